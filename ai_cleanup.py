@@ -2,16 +2,19 @@
 AI-powered text cleanup using local Ollama LLM.
 Provides grammar fixes and formality adjustments while staying 100% offline.
 """
+import functools
 import requests
 from typing import Optional, List
 from urllib.parse import urlparse
 
 
+@functools.lru_cache(maxsize=32)
 def validate_ollama_url(url: str) -> bool:
     """
     Validate Ollama URL is safe (localhost or private IP only).
 
     This prevents SSRF attacks by restricting URLs to local/private networks.
+    Results are cached per URL string, since the configured URL rarely changes.
 
     Args:
         url: URL to validate
@@ -0,0 +1,75 @@
+"""
+Build the navigation icon atlas for the settings window.
+
+Packs the decoded RGBA pixels of every assets/icons/icon_<name>.png into one
+binary file so the settings GUI can load all nav icons with a single read
+instead of opening and decoding each PNG.
+
+Usage:
+    python build_icon_atlas.py
+
+Output:
+    assets/icons/nav_atlas.bin   - Raw RGBA pixel data, icons back to back
+    assets/icons/nav_atlas.json  - Manifest: {name: {"offset": int, "size": [w, h]}}
+
+Re-run after adding or editing any icon_*.png.
+"""
+import json
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+ICONS_DIR = Path(__file__).parent / "assets" / "icons"
+ATLAS_FILE = ICONS_DIR / "nav_atlas.bin"
+MANIFEST_FILE = ICONS_DIR / "nav_atlas.json"
+
+
+def build_atlas(icons_dir=ICONS_DIR):
+    """
+    Decode all icon PNGs and concatenate their RGBA bytes.
+
+    Args:
+        icons_dir: Directory containing icon_<name>.png files
+
+    Returns:
+        tuple: (atlas bytes, manifest dict)
+    """
+    chunks = []
+    manifest = {}
+    offset = 0
+
+    for png_path in sorted(icons_dir.glob("icon_*.png")):
+        name = png_path.stem[len("icon_"):]
+        with Image.open(png_path) as img:
+            rgba = img.convert("RGBA")
+        raw = rgba.tobytes()
+        manifest[name] = {"offset": offset, "size": list(rgba.size)}
+        chunks.append(raw)
+        offset += len(raw)
+
+    return b"".join(chunks), manifest
+
+
+def main():
+    """Build the atlas and manifest next to the source icons."""
+    print("MurmurTone Icon Atlas Builder")
+    print("=" * 50)
+
+    data, manifest = build_atlas()
+    if not manifest:
+        print(f"ERROR: No icon_*.png files found in {ICONS_DIR}")
+        return 1
+
+    ATLAS_FILE.write_bytes(data)
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"Packed {len(manifest)} icons ({len(data)} bytes)")
+    print(f"  - {ATLAS_FILE}")
+    print(f"  - {MANIFEST_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ Handles loading/saving settings to JSON file.
 """
 import json
 import os
+import tempfile
 import sounddevice as sd
 import dpapi
 
@@ -265,10 +266,35 @@ def load_config():
     return DEFAULTS.copy()
 
 
+# (path, sorted plaintext JSON, file stamp) of this process's last write
+_last_saved = None
+
+
+def _file_stamp(path):
+    """Return (mtime_ns, size) for path, or None if it can't be read."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def save_config(config):
-    """Save settings to JSON file."""
+    """
+    Save settings to JSON file.
+
+    The file is replaced atomically. If these exact settings were the last
+    ones this process wrote and the file hasn't changed since, nothing is
+    written.
+    """
+    global _last_saved
     config_path = get_config_path()
 
+    snapshot = json.dumps(config, sort_keys=True)
+    if (_last_saved and _last_saved[:2] == (config_path, snapshot)
+            and _file_stamp(config_path) == _last_saved[2]):
+        return
+
     # Create a copy to avoid modifying the original
     config_to_save = config.copy()
 
@@ -280,8 +306,22 @@ def save_config(config):
             config_to_save["license_key_encrypted"] = encrypted
             config_to_save["license_key"] = ""  # Don't store plain text
 
-    with open(config_path, "w") as f:
-        json.dump(config_to_save, f, indent=2)
+    # Write a temp file next to the target, then swap it in
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(config_path) or ".", prefix=".settings-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(config_to_save, f, indent=2)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _last_saved = (config_path, snapshot, _file_stamp(config_path))
 
 
 def hotkey_to_string(hotkey):
@@ -19,6 +19,9 @@ datas = [
     ('LICENSE', '.'),
     ('THIRD_PARTY_LICENSES.md', '.'),
     ('assets/logo/murmurtone-logo-icon.ico', 'assets/logo'),
+    # Settings nav icons, prebuilt by build_icon_atlas.py
+    ('assets/icons/nav_atlas.bin', 'assets/icons'),
+    ('assets/icons/nav_atlas.json', 'assets/icons'),
 ]
 
 # Check if bundled model exists and include it
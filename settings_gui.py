@@ -4,21 +4,37 @@ Rebuilt to exactly match the HTML mockup (Slack Examples/settings-mockup-v2.html
 """
 import version_check  # noqa: F401 - Must be first, checks Python version
 
-import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 import webbrowser
+import json
+import logging
 import os
 import sys
 import threading
+import queue
 import subprocess
 import ctypes
-from PIL import Image
+import functools
+import heapq
+import math
+import time
+from collections import deque
+from types import MappingProxyType
+
+import sounddevice as sd  # Microphone test; config already loads it, so this is free
 
 import config
 import settings_logic
 from theme import make_combobox_clickable
-from ai_cleanup import validate_ollama_url
+
+log = logging.getLogger("murmurtone")
+
+# Heavy GUI modules are imported on first window open (see init_gui) so that
+# importing this module doesn't pay for customtkinter/PIL/numpy start-up.
+ctk = None
+Image = None
+np = None  # numpy: meter gradient and microphone test
 
 # =============================================================================
 # COLORS - Exact match to HTML mockup CSS variables
@@ -42,8 +58,22 @@ WARNING = "#f59e0b"
 ERROR = "#ef4444"
 ERROR_DARK = "#dc2626"     # Darker red for hover states
 
+
+def _hex_to_rgb(hex_color):
+    """Convert '#rrggbb' to an (r, g, b) int tuple."""
+    value = int(hex_color[1:], 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+# RGB tuples for colors used in image gradients (parsed once at import)
+SUCCESS_RGB = _hex_to_rgb(SUCCESS)
+WARNING_RGB = _hex_to_rgb(WARNING)
+ERROR_RGB = _hex_to_rgb(ERROR)
+SLATE_800_RGB = _hex_to_rgb(SLATE_800)
+
 # Font family - Roboto Serif for softer, friendlier feel
 FONT_FAMILY = "Roboto Serif"
+MONO_FONT_FAMILY = "Consolas"  # Hotkey badge
 
 # =============================================================================
 # SPACING - Exact match to HTML mockup CSS variables
@@ -60,54 +90,108 @@ WINDOW_WIDTH = 900
 WINDOW_HEIGHT = 650
 SIDEBAR_WIDTH = 220
 
-# =============================================================================
-# SAMPLE RATE OPTIONS
-# =============================================================================
-SAMPLE_RATE_OPTIONS = {
-    16000: "16000 Hz (Recommended)",
-    44100: "44100 Hz (CD Quality)",
-    48000: "48000 Hz (Studio)",
-}
+# Virtualized list rows (ListEditorDialog)
+LIST_ROW_HEIGHT = 38  # Row pitch: 36px row + 1px gap above and below
+LIST_OVERSCAN = 3     # Extra rows rendered past each edge of the viewport
 
-# =============================================================================
-# RECORDING MODE LABELS - Display labels for recording modes
-# =============================================================================
-RECORDING_MODE_LABELS = {
-    "push_to_talk": "Push-to-Talk",
-    "toggle": "Toggle",
-    "auto_stop": "Auto-stop",
-}
-RECORDING_MODE_VALUES = {v: k for k, v in RECORDING_MODE_LABELS.items()}
+# ListEditorDialog is 500px wide; columns share what's left after the dialog
+# padding (16*2), list frame padding (2*2) and scrollbar (~16)
+LIST_COLUMNS_WIDTH = 500 - 32 - 4 - 16
+LIST_LABEL_PACK = {"side": "left", "padx": SPACE_SM, "pady": SPACE_XS}
 
-# =============================================================================
-# PASTE MODE LABELS
-# =============================================================================
-PASTE_MODE_LABELS = {
-    "clipboard": "Clipboard",
-    "type": "Type",
-}
-PASTE_MODE_VALUES = {v: k for k, v in PASTE_MODE_LABELS.items()}
+# Searchable dropdown popup (long lists: input devices, languages)
+DROPDOWN_VISIBLE_ROWS = 10
+DROPDOWN_ROW_HEIGHT = 28
 
-# =============================================================================
-# PREVIEW POSITION LABELS
-# =============================================================================
-PREVIEW_POSITION_LABELS = {
-    "top_left": "Top Left",
-    "top_right": "Top Right",
-    "bottom_left": "Bottom Left",
-    "bottom_right": "Bottom Right",
-    "center": "Center",
-}
-PREVIEW_POSITION_VALUES = {v: k for k, v in PREVIEW_POSITION_LABELS.items()}
+HISTORY_PAGE_SIZE = 50  # History rows rendered per page as the user scrolls
+
+EXPORT_BUFFER_SIZE = 1 << 20  # History export write buffer (1 MB)
+
+METER_FRAME_MS = 33  # Minimum interval between noise meter redraws (~30 FPS)
+METER_FRAME_STEP = 3  # Meter level images are pre-composited every 3px
 
 # =============================================================================
-# PREVIEW THEME LABELS
+# LABEL MAPS - Config value <-> display label, both directions built once
 # =============================================================================
-PREVIEW_THEME_LABELS = {
-    "dark": "Dark",
-    "light": "Light",
+
+class LabelMap:
+    """Read-only two-way mapping between config values and display labels."""
+
+    __slots__ = ("fwd", "rev", "labels")
+
+    def __init__(self, pairs):
+        """
+        Args:
+            pairs: Sequence of (value, label) tuples, in display order
+        """
+        self.fwd = MappingProxyType(dict(pairs))
+        self.rev = MappingProxyType({label: value for value, label in pairs})
+        self.labels = tuple(label for _, label in pairs)  # Dropdown values
+
+
+SAMPLE_RATE = LabelMap([
+    (16000, "16000 Hz (Recommended)"),
+    (44100, "44100 Hz (CD Quality)"),
+    (48000, "48000 Hz (Studio)"),
+])
+
+RECORDING_MODE = LabelMap([
+    ("push_to_talk", "Push-to-Talk"),
+    ("toggle", "Toggle"),
+    ("auto_stop", "Auto-stop"),
+])
+
+PASTE_MODE = LabelMap([
+    ("clipboard", "Clipboard"),
+    ("type", "Type"),
+])
+
+PREVIEW_POSITION = LabelMap([
+    ("top_left", "Top Left"),
+    ("top_right", "Top Right"),
+    ("bottom_left", "Bottom Left"),
+    ("bottom_right", "Bottom Right"),
+    ("center", "Center"),
+])
+
+PREVIEW_THEME = LabelMap([
+    ("dark", "Dark"),
+    ("light", "Light"),
+])
+
+LANGUAGE = LabelMap(list(config.LANGUAGE_LABELS.items()))
+
+PROCESSING_MODE = LabelMap(list(config.PROCESSING_MODE_LABELS.items()))
+
+# Legacy names (read-only views onto the maps above)
+SAMPLE_RATE_OPTIONS = SAMPLE_RATE.fwd
+RECORDING_MODE_LABELS = RECORDING_MODE.fwd
+RECORDING_MODE_VALUES = RECORDING_MODE.rev
+PASTE_MODE_LABELS = PASTE_MODE.fwd
+PASTE_MODE_VALUES = PASTE_MODE.rev
+PREVIEW_POSITION_LABELS = PREVIEW_POSITION.fwd
+PREVIEW_POSITION_VALUES = PREVIEW_POSITION.rev
+PREVIEW_THEME_LABELS = PREVIEW_THEME.fwd
+PREVIEW_THEME_VALUES = PREVIEW_THEME.rev
+
+# Per-event feedback sounds: (Tk variable attribute, config key, checkbox label)
+SOUND_CHECKBOXES = (
+    ("sound_processing_var", "sound_processing", "Processing sound"),
+    ("sound_success_var", "sound_success", "Success sound"),
+    ("sound_error_var", "sound_error", "Error sound"),
+    ("sound_command_var", "sound_command", "Command sound"),
+)
+
+# Help text shown under the hotkey and paste method controls, by display label
+_HOTKEY_HELP_TEXTS = {
+    "Push-to-Talk": "Press and hold to record audio",
+    "Toggle": "Press to start recording, press again to stop",
+    "Auto-stop": "Press to start recording, stops after silence",
+}
+_PASTE_HELP_TEXTS = {
+    "Clipboard": "Copies text to clipboard and pastes with Ctrl+V",
+    "Type": "Simulates typing each character (slower but more compatible)",
 }
-PREVIEW_THEME_VALUES = {v: k for k, v in PREVIEW_THEME_LABELS.items()}
 
 # =============================================================================
 # ICONS - PNG icons matching mockup SVG line icons
@@ -116,108 +200,673 @@ PREVIEW_THEME_VALUES = {v: k for k, v in PREVIEW_THEME_LABELS.items()}
 ICON_NAMES = ["general", "audio", "recognition", "text", "advanced", "about"]
 ICON_SIZE = (20, 20)  # Matches mockup .nav-icon size
 
+# Prebuilt atlas of decoded icon pixels (see build_icon_atlas.py)
+ICON_ATLAS_FILE = "nav_atlas.bin"
+ICON_ATLAS_MANIFEST = "nav_atlas.json"
+
+_icon_images = None  # name -> PIL Image, decoded once per process
+
+
+def _load_icon_atlas(icons_dir):
+    """Decode all nav icons from the prebuilt atlas with a single read.
+
+    Returns:
+        dict: name -> PIL Image (empty if the atlas is missing or invalid)
+    """
+    try:
+        with open(os.path.join(icons_dir, ICON_ATLAS_MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        with open(os.path.join(icons_dir, ICON_ATLAS_FILE), "rb") as f:
+            data = f.read()
+
+        images = {}
+        for name, entry in manifest.items():
+            width, height = entry["size"]
+            offset = entry["offset"]
+            stride = width * height * 4
+            images[name] = Image.frombytes("RGBA", (width, height), data[offset:offset + stride])
+        return images
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Icon atlas unavailable, loading PNGs: {e}")
+        return {}
+
+
 def load_nav_icons():
     """Load navigation icons as CTkImage objects."""
-    icons = {}
+    global _icon_images
     icons_dir = resource_path(os.path.join("assets", "icons"))
+    if _icon_images is None:
+        _icon_images = _load_icon_atlas(icons_dir)
 
+    icons = {}
     for name in ICON_NAMES:
+        img = _icon_images.get(name)
+        if img is not None:
+            icons[name] = ctk.CTkImage(light_image=img, dark_image=img, size=ICON_SIZE)
+            continue
+
+        # Fallback: icon not in atlas, load the individual PNG
         icon_path = os.path.join(icons_dir, f"icon_{name}.png")
-        if os.path.exists(icon_path):
-            try:
-                img = Image.open(icon_path)
-                icons[name] = ctk.CTkImage(light_image=img, dark_image=img, size=ICON_SIZE)
-            except Exception as e:
-                print(f"Failed to load icon {name}: {e}")
-                icons[name] = None
-        else:
+        try:
+            with Image.open(icon_path, formats=("PNG",)) as png:
+                img = png.convert("RGBA")  # Decodes now and releases the file
+            _icon_images[name] = img
+            icons[name] = ctk.CTkImage(light_image=img, dark_image=img, size=ICON_SIZE)
+        except FileNotFoundError:
             print(f"Icon not found: {icon_path}")
             icons[name] = None
+        except Exception as e:
+            print(f"Failed to load icon {name}: {e}")
+            icons[name] = None
 
     return icons
 
 
+# PyInstaller unpack dir when frozen, otherwise the working directory
+_RESOURCE_BASE = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
+
+@functools.lru_cache(maxsize=256)
 def resource_path(relative_path):
     """Get absolute path to resource."""
-    try:
-        base_path = sys._MEIPASS
-    except AttributeError:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_RESOURCE_BASE, relative_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _existing_resource(relative_path):
+    """Absolute path to a bundled resource, or None if it isn't there (checked once)."""
+    path = resource_path(relative_path)
+    return path if os.path.exists(path) else None
+
+
+_fonts_loaded = False
 
 
 def load_custom_fonts():
     """Load bundled fonts for the current process (Windows only)."""
-    if sys.platform != "win32":
+    global _fonts_loaded
+    if sys.platform != "win32" or _fonts_loaded:
         return
     fonts_dir = os.path.join(os.path.dirname(__file__), "assets", "fonts")
-    if os.path.exists(fonts_dir):
-        FR_PRIVATE = 0x10  # Font is available only to this process
-        for filename in os.listdir(fonts_dir):
-            if filename.lower().endswith(".ttf"):
-                font_path = os.path.join(fonts_dir, filename)
-                ctypes.windll.gdi32.AddFontResourceExW(font_path, FR_PRIVATE, 0)
+    try:
+        with os.scandir(fonts_dir) as it:
+            font_paths = [e.path for e in it if e.is_file() and e.name.lower().endswith(".ttf")]
+    except OSError:
+        return
+
+    FR_PRIVATE = 0x10  # Font is available only to this process
+    add_font = ctypes.windll.gdi32.AddFontResourceExW
+    add_font.argtypes = [ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_void_p]
+    for font_path in font_paths:
+        add_font(font_path, FR_PRIVATE, None)
+    # FR_PRIVATE registrations live as long as the process, so once is enough
+    _fonts_loaded = True
+
+
+_gui_initialized = False
+
 
+def init_gui():
+    """Import GUI modules, load fonts and configure CustomTkinter (once)."""
+    global ctk, Image, np, _gui_initialized
+    if _gui_initialized:
+        return
+
+    import customtkinter
+    from PIL import Image as PILImage
+    ctk = customtkinter
+    Image = PILImage
 
-# Load custom fonts before initializing GUI
-load_custom_fonts()
+    # Audio test dependency; the microphone test reports it if missing
+    try:
+        import numpy
+        np = numpy
+    except ImportError:
+        pass
 
-# Configure CustomTkinter
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("dark-blue")
+    # Load custom fonts before initializing GUI
+    load_custom_fonts()
+
+    # Configure CustomTkinter
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("dark-blue")
+    _gui_initialized = True
+
+
+# =============================================================================
+# CACHED RESOURCES - Fonts, images and display helpers shared across widgets
+# =============================================================================
+
+@functools.lru_cache(maxsize=32)
+def _font(size, weight="normal", family=FONT_FAMILY):
+    """
+    Shared CTkFont for the given size, weight and family.
+
+    Tk fonts belong to the interpreter, so the cache is cleared when the
+    settings window is destroyed (see SettingsWindow.close).
+
+    Args:
+        size: Font size in points
+        weight: "normal" or "bold"
+        family: Font family (defaults to the UI font)
+
+    Returns:
+        ctk.CTkFont: Cached font instance
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_ctk_image(path, size):
+    """
+    Decode a PNG once and share the CTkImage (cleared with _font in close()).
+
+    Args:
+        path: Path to the PNG file
+        size: (width, height) display size
+
+    Returns:
+        ctk.CTkImage: Cached image instance
+    """
+    with Image.open(path, formats=("PNG",)) as png:
+        img = png.convert("RGBA")
+    return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_hotkey_str(hotkey):
+    """
+    Format a "ctrl+shift_r"-style hotkey string for display.
+
+    Args:
+        hotkey: Hotkey string with "+"-separated key names
+
+    Returns:
+        str: Display text, e.g. "Ctrl + Shift R"
+    """
+    if not hotkey:
+        return "Not set"
+    return " + ".join(p.replace("_", " ").title() for p in hotkey.split("+"))
+
+
+@functools.lru_cache(maxsize=4)
+def _meter_gradient_row(width):
+    """
+    One row of the audio meter gradient (green -> orange -> red).
+
+    Matches mockup line 575: SUCCESS to WARNING over 0-70%, then WARNING to
+    ERROR over the rest.
+
+    Args:
+        width: Meter width in pixels
+
+    Returns:
+        numpy.ndarray: Read-only (width, 3) uint8 RGB row
+    """
+    x = np.arange(width, dtype=np.float64)
+    split = width * 0.7
+    low = (x < split)[:, None]
+    ratio = np.where(x < split, x / split, (x - split) / (width * 0.3))[:, None]
+    start = np.where(low, SUCCESS_RGB, WARNING_RGB)
+    end = np.where(low, WARNING_RGB, ERROR_RGB)
+    row = (start + (end - start) * ratio).astype(np.uint8)
+    row.flags.writeable = False
+    return row
 
 
 # =============================================================================
 # DEBOUNCE MANAGER - For autosave functionality
 # =============================================================================
 
+class Scheduler:
+    """Runs delayed callbacks for a window from a single Tk after() timer.
+
+    Callbacks are kept in a min-heap by deadline; only the earliest one has a
+    live Tk timer. Re-registering a key replaces its previous callback.
+    """
+
+    def __init__(self, window):
+        """
+        Args:
+            window: Tkinter window (for after() scheduling)
+        """
+        self.window = window
+        self._heap = []      # (deadline, seq, key) - may hold stale entries
+        self._pending = {}   # key -> (deadline, seq, callback)
+        self._seq = 0
+        self._pump_id = None
+        self._pump_deadline = None
+
+    def register(self, key, delay_ms, callback):
+        """Run callback after delay_ms, replacing any pending callback for key."""
+        deadline = time.monotonic() + delay_ms / 1000
+        self._seq += 1
+        self._pending[key] = (deadline, self._seq, callback)
+        heapq.heappush(self._heap, (deadline, self._seq, key))
+        self._arm()
+
+    def cancel(self, key):
+        """Drop the pending callback for key. Returns True if one was pending."""
+        # Heap entry is discarded lazily when it reaches the top
+        return self._pending.pop(key, None) is not None
+
+    def _is_live(self, heap_entry):
+        entry = self._pending.get(heap_entry[2])
+        return entry is not None and entry[1] == heap_entry[1]
+
+    def _arm(self):
+        """Make sure one Tk timer is set for the earliest live deadline."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        if not self._heap:
+            if self._pump_id is not None:
+                self.window.after_cancel(self._pump_id)
+                self._pump_id = None
+                self._pump_deadline = None
+            return
+
+        deadline = self._heap[0][0]
+        if self._pump_id is not None:
+            if self._pump_deadline <= deadline:
+                return  # Existing timer fires first and will re-arm
+            self.window.after_cancel(self._pump_id)
+
+        delay_ms = max(0, math.ceil((deadline - time.monotonic()) * 1000))
+        self._pump_id = self.window.after(delay_ms, self._pump)
+        self._pump_deadline = deadline
+
+    def _pump(self):
+        """Run every callback whose deadline has passed, then re-arm."""
+        self._pump_id = None
+        self._pump_deadline = None
+        now = time.monotonic()
+
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            heap_entry = heapq.heappop(self._heap)
+            if self._is_live(heap_entry):
+                due.append(self._pending.pop(heap_entry[2])[2])
+
+        try:
+            for callback in due:
+                # One failing callback mustn't drop the others already popped
+                try:
+                    callback()
+                except Exception:
+                    log.exception("Scheduled callback failed")
+        finally:
+            self._arm()
+
+
+_scheduler = None
+
+
+def get_scheduler(window):
+    """Get the shared Scheduler for window (one per settings window)."""
+    global _scheduler
+    if _scheduler is None or _scheduler.window is not window:
+        _scheduler = Scheduler(window)
+    return _scheduler
+
+
 class DebounceManager:
     """Manages debounced saves for text inputs and sliders."""
 
+    # Timer states
+    _IDLE = 0     # Nothing scheduled
+    _ARMED = 1    # Waiting on the shared scheduler
+    _FIRING = 2   # Save callback currently running
+
     def __init__(self, window, save_callback, delay_ms=1500):
         """
         Args:
-            window: Tkinter window (for after() scheduling)
+            window: Tkinter window (owner of the shared scheduler)
             save_callback: Function to call when debounce timer expires
             delay_ms: Delay in milliseconds before saving
         """
-        self._window = window
+        self._scheduler = get_scheduler(window)
         self._save_callback = save_callback
         self._delay_ms = delay_ms
-        self._pending_id = None
+        self._state = self._IDLE
+        self._rearm = False
+
+    @property
+    def pending(self):
+        """True while a save is scheduled but hasn't run yet."""
+        return self._state == self._ARMED
 
     def schedule(self):
         """Schedule a debounced save. Cancels any pending save."""
-        if self._pending_id:
-            self._window.after_cancel(self._pending_id)
-        self._pending_id = self._window.after(self._delay_ms, self._execute)
+        if self._state == self._FIRING:
+            # Save in progress - re-arm once it finishes instead of nesting
+            self._rearm = True
+            return
+        self._scheduler.register(self, self._delay_ms, self._execute)
+        self._state = self._ARMED
 
     def _execute(self):
         """Execute the save callback."""
-        self._pending_id = None
-        self._save_callback()
+        self._state = self._FIRING
+        try:
+            self._save_callback()
+        finally:
+            self._state = self._IDLE
+            if self._rearm:
+                self._rearm = False
+                self.schedule()
 
     def flush(self):
         """Immediately execute pending save if any."""
-        if self._pending_id:
-            self._window.after_cancel(self._pending_id)
-            self._pending_id = None
-            self._save_callback()
+        if self._state == self._ARMED:
+            self._scheduler.cancel(self)
+            self._execute()
 
     def cancel(self):
         """Cancel any pending save without executing."""
-        if self._pending_id:
-            self._window.after_cancel(self._pending_id)
-            self._pending_id = None
+        self._rearm = False
+        if self._state == self._ARMED:
+            self._scheduler.cancel(self)
+            self._state = self._IDLE
+
+
+# =============================================================================
+# SEARCHABLE DROPDOWN
+# =============================================================================
+
+class SearchableDropdown:
+    """
+    Dropdown for long option lists with a search box.
+
+    Unlike CTkComboBox, which builds a menu entry per value, the popup holds a
+    fixed pool of DROPDOWN_VISIBLE_ROWS buttons that are relabeled as the
+    list is filtered or scrolled.
+    """
+
+    def __init__(self, parent, values, variable, command=None, width=160):
+        """
+        Args:
+            parent: Parent widget
+            values: Option labels in display order
+            variable: StringVar holding the selected label
+            command: Optional callback with the chosen label
+            width: Width of the dropdown and its popup in pixels
+        """
+        self.values = list(values)
+        self.variable = variable
+        self.command = command
+        self.width = width
+        self._matches = self.values
+        self._offset = 0
+        self._popup = None
+        self._rows = []
+
+        self.button = ctk.CTkButton(
+            parent,
+            textvariable=variable,
+            width=width,
+            height=36,
+            corner_radius=12,
+            border_width=1,
+            fg_color=SLATE_800,
+            border_color=SLATE_600,
+            hover_color=SLATE_700,
+            text_color=SLATE_200,
+            font=_font(13),
+            anchor="w",
+            command=self._toggle,
+        )
+
+    def pack(self, **kwargs):
+        """Pack the dropdown button."""
+        self.button.pack(**kwargs)
+
+    def configure(self, values=None):
+        """Replace the option list (e.g. after refreshing devices)."""
+        if values is not None:
+            self.values = list(values)
+            if self._popup is not None:
+                self._apply_filter()
+
+    def _toggle(self):
+        """Open the popup, or close it if already open."""
+        if self._popup is not None:
+            self._close()
+        else:
+            self._open()
+
+    def _open(self):
+        """Show the popup below the button with the current value in view."""
+        popup = ctk.CTkToplevel(self.button)
+        popup.overrideredirect(True)
+        popup.configure(fg_color=SLATE_700)
+        x = self.button.winfo_rootx()
+        y = self.button.winfo_rooty() + self.button.winfo_height() + 2
+        popup.geometry(f"+{x}+{y}")
+        self._popup = popup
+
+        self._query_var = ctk.StringVar(value="")
+        search = ctk.CTkEntry(
+            popup,
+            textvariable=self._query_var,
+            placeholder_text="Search...",
+            width=self.width,
+            height=30,
+            corner_radius=8,
+            border_width=1,
+            fg_color=SLATE_800,
+            border_color=SLATE_600,
+            text_color=SLATE_200,
+            font=_font(13),
+        )
+        search.pack(padx=SPACE_XS, pady=SPACE_XS)
+
+        self._rows = []
+        for slot in range(DROPDOWN_VISIBLE_ROWS):
+            row = ctk.CTkButton(
+                popup,
+                text="",
+                width=self.width,
+                height=DROPDOWN_ROW_HEIGHT,
+                corner_radius=6,
+                fg_color="transparent",
+                hover_color=SLATE_600,
+                text_color=SLATE_200,
+                font=_font(13),
+                anchor="w",
+                command=lambda slot=slot: self._choose(self._offset + slot),
+            )
+            self._rows.append(row)
+
+        self._query_var.trace_add("write", lambda *args: self._apply_filter())
+        search.bind("<Return>", lambda e: self._choose(0))
+        popup.bind("<Escape>", lambda e: self._close())
+        popup.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1))
+        popup.bind("<Button-4>", lambda e: self._scroll(-1))
+        popup.bind("<Button-5>", lambda e: self._scroll(1))
+        # Clicks outside the popup are delivered here while it holds the grab
+        popup.bind("<Button-1>", self._on_click, add="+")
+
+        self._apply_filter()
+        current = self.variable.get()
+        if current in self._matches:
+            self._scroll_to(self._matches.index(current))
+        popup.grab_set()
+        search.focus_set()
+
+    def _apply_filter(self):
+        """Refilter the options from the search box and show the first page."""
+        self._matches = settings_logic.filter_options(self.values, self._query_var.get())
+        self._offset = 0
+        self._render_rows()
+
+    def _render_rows(self):
+        """Relabel the pooled rows for the current window of matches."""
+        current = self.variable.get()
+        for slot, row in enumerate(self._rows):
+            index = self._offset + slot
+            if index < len(self._matches):
+                label = self._matches[index]
+                row.configure(text=label, fg_color=SLATE_600 if label == current else "transparent")
+                row.pack(padx=SPACE_XS, pady=(0, 1))
+            else:
+                row.pack_forget()
+
+    def _scroll(self, rows):
+        """Move the visible window by a number of rows."""
+        self._scroll_to(self._offset + rows)
+
+    def _scroll_to(self, offset):
+        """Show matches starting at offset (clamped to the list)."""
+        max_offset = max(0, len(self._matches) - DROPDOWN_VISIBLE_ROWS)
+        offset = max(0, min(offset, max_offset))
+        if offset != self._offset:
+            self._offset = offset
+            self._render_rows()
+
+    def _choose(self, index):
+        """Select the match at index and close the popup."""
+        if index >= len(self._matches):
+            return
+        choice = self._matches[index]
+        self._close()
+        self.variable.set(choice)
+        if self.command:
+            self.command(choice)
+
+    def _on_click(self, event):
+        """Close the popup when the click landed outside it."""
+        popup = self._popup
+        inside_x = 0 <= event.x_root - popup.winfo_rootx() < popup.winfo_width()
+        inside_y = 0 <= event.y_root - popup.winfo_rooty() < popup.winfo_height()
+        if not (inside_x and inside_y):
+            self._close()
+
+    def _close(self):
+        """Destroy the popup and its row pool."""
+        if self._popup is not None:
+            self._popup.grab_release()
+            self._popup.destroy()
+            self._popup = None
+            self._rows = []
 
 
 # =============================================================================
 # EDITOR DIALOGS
 # =============================================================================
 
+def _center_dialog(dialog, parent, width, height):
+    """
+    Center a fixed-size dialog over its parent window.
+
+    Reads the parent's current geometry directly rather than flushing idle
+    tasks for the new dialog; falls back to the screen center when the
+    parent isn't mapped yet.
+
+    Args:
+        dialog: Toplevel to position
+        parent: Window to center on
+        width: Dialog width in pixels
+        height: Dialog height in pixels
+    """
+    if parent.winfo_viewable():
+        x = parent.winfo_x() + (parent.winfo_width() - width) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - height) // 2
+    else:
+        x = (parent.winfo_screenwidth() - width) // 2
+        y = (parent.winfo_screenheight() - height) // 2
+    dialog.geometry(f"+{x}+{y}")
+
+
+def _plain_frame(parent, **pack_kwargs):
+    """
+    Create and pack a plain tk.Frame for an invisible layout container.
+
+    A transparent CTkFrame still draws through its own canvas; wrappers that
+    only group widgets on the page background don't need one. Pack padding
+    is scaled the same way CTk widgets scale it in their own pack().
+
+    Args:
+        parent: Parent widget (on the SLATE_900 page background)
+        **pack_kwargs: Options for pack()
+
+    Returns:
+        tk.Frame: The packed frame
+    """
+    frame = tk.Frame(parent, bg=SLATE_900, highlightthickness=0, bd=0)
+    scaling = ctk.ScalingTracker.get_widget_scaling(parent)
+    for key in ("padx", "pady"):
+        pad = pack_kwargs.get(key)
+        if isinstance(pad, tuple):
+            pack_kwargs[key] = tuple(round(p * scaling) for p in pad)
+        elif pad is not None:
+            pack_kwargs[key] = round(pad * scaling)
+    frame.pack(**pack_kwargs)
+    return frame
+
+
+class _StatusDot:
+    """Circular status indicator drawn as one oval on a plain tk.Canvas."""
+
+    __slots__ = ("canvas", "_oval")
+
+    def __init__(self, parent, color, size=10):
+        """
+        Args:
+            parent: Parent widget (on the SLATE_900 page background)
+            color: Initial fill color
+            size: Diameter before DPI scaling
+        """
+        scaling = ctk.ScalingTracker.get_widget_scaling(parent)
+        size = round(size * scaling)
+        self.canvas = tk.Canvas(parent, width=size, height=size, bg=SLATE_900,
+                                highlightthickness=0, bd=0)
+        self._oval = self.canvas.create_oval(0, 0, size, size, fill=color, outline="")
+        self.canvas.pack(side="left", padx=(0, round(SPACE_XS * scaling)))
+
+    def configure(self, fg_color):
+        """Change the dot color (same keyword as the CTkFrame it replaces)."""
+        self.canvas.itemconfigure(self._oval, fill=fg_color)
+
+
+def _tagged_ancestor(widget, attr):
+    """
+    Walk up from a clicked widget to the nearest one carrying ``attr``.
+
+    CTk widgets deliver events from their inner canvas/label, so row
+    click handlers look up the row through the widget's masters.
+
+    Args:
+        widget: Widget the event was delivered to
+        attr: Attribute name set on the row widget
+
+    Returns:
+        The tagged widget, or None if no ancestor carries the attribute
+    """
+    while widget is not None:
+        if hasattr(widget, attr):
+            return widget
+        widget = getattr(widget, "master", None)
+    return None
+
+
+class _ListRow:
+    """A recycled row in a virtualized list (see ListEditorDialog)."""
+
+    __slots__ = ("frame", "labels", "window_id", "index")
+
+    def __init__(self, frame, window_id):
+        self.frame = frame
+        self.labels = []
+        self.window_id = window_id
+        self.index = None  # Item index currently shown, None while pooled
+
+
 class ListEditorDialog:
     """Base class for list editor dialogs (Dictionary, Vocabulary, Shortcuts)."""
 
+    _ITEMS_ARE_DICTS = False  # Subclasses holding dict items copy each one
+
     def __init__(self, parent, title, items, columns, on_save):
         """
         Args:
@@ -228,10 +877,16 @@ class ListEditorDialog:
             on_save: Callback with updated items list
         """
         self.parent = parent
-        self.items = [item.copy() if isinstance(item, dict) else item for item in items]
+        if self._ITEMS_ARE_DICTS:
+            # Copy dicts so edits stay local; stray non-dict entries pass through as-is
+            self.items = [dict(item) if isinstance(item, dict) else item for item in items]
+        else:
+            self.items = list(items)
+        self._display_cache = [None] * len(self.items)  # Per-item display strings
         self.columns = columns
         self.on_save = on_save
         self.selected_index = None
+        self._refresh_pending = None  # after_idle id of a queued rebuild
 
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title(title)
@@ -241,10 +896,7 @@ class ListEditorDialog:
         self.dialog.grab_set()
 
         # Center on parent
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 500) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 400) // 2
-        self.dialog.geometry(f"+{x}+{y}")
+        _center_dialog(self.dialog, parent, 500, 400)
 
         self._create_ui()
         self._refresh_list()
@@ -259,10 +911,7 @@ class ListEditorDialog:
         list_frame = ctk.CTkFrame(main, fg_color=SLATE_800, corner_radius=8)
         list_frame.pack(fill="both", expand=True, pady=(0, SPACE_MD))
 
-        # Calculate column width based on dialog width and number of columns
-        # Dialog is 500px, minus padding (16*2) and list frame padding (2*2) and scrollbar (~16)
-        available_width = 500 - 32 - 4 - 16
-        self.col_width = available_width // len(self.columns)
+        self.col_width = LIST_COLUMNS_WIDTH // len(self.columns)
 
         # Header row
         header = ctk.CTkFrame(list_frame, fg_color=SLATE_700, corner_radius=0)
@@ -273,19 +922,36 @@ class ListEditorDialog:
                 header,
                 text=col,
                 width=self.col_width,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
+                font=_font(12, "bold"),
                 text_color=SLATE_300,
                 anchor="w",
             )
-            lbl.pack(side="left", padx=SPACE_SM, pady=SPACE_XS)
+            lbl.pack(**LIST_LABEL_PACK)
 
-        # Scrollable list
-        self.list_frame = ctk.CTkScrollableFrame(
+        # Virtualized list: a canvas viewport that only holds row widgets for
+        # the items currently in view; rows are recycled while scrolling
+        self.list_scrollbar = ctk.CTkScrollbar(list_frame, button_color=SLATE_600)
+        self.list_scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=2)
+
+        self.list_canvas = tk.Canvas(
             list_frame,
-            fg_color="transparent",
-            scrollbar_button_color=SLATE_600,
+            bg=SLATE_800,
+            highlightthickness=0,
+            yscrollincrement=LIST_ROW_HEIGHT,
         )
-        self.list_frame.pack(fill="both", expand=True, padx=2, pady=2)
+        self.list_canvas.pack(side="left", fill="both", expand=True, padx=2, pady=2)
+        self.list_canvas.configure(yscrollcommand=self._on_list_scroll)
+        self.list_scrollbar.configure(command=self.list_canvas.yview)
+        self.list_canvas.bind("<Configure>", self._on_list_resize)
+
+        # Wheel events bubble up to the dialog through each widget's bindtags
+        self.dialog.bind("<MouseWheel>", self._on_mousewheel)
+        self.dialog.bind("<Button-4>", lambda e: self.list_canvas.yview_scroll(-3, "units"))
+        self.dialog.bind("<Button-5>", lambda e: self.list_canvas.yview_scroll(3, "units"))
+
+        self._row_pool = []      # Hidden rows ready for reuse
+        self._visible_rows = {}  # item index -> row shown on the canvas
+        self._viewport_width = 1
 
         # Button row
         btn_row = ctk.CTkFrame(main, fg_color="transparent")
@@ -298,7 +964,7 @@ class ListEditorDialog:
             height=32,
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self._add_item,
         )
         self.add_btn.pack(side="left", padx=(0, SPACE_SM))
@@ -310,7 +976,7 @@ class ListEditorDialog:
             height=32,
             fg_color=SLATE_700,
             hover_color=SLATE_600,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self._edit_item,
         )
         self.edit_btn.pack(side="left", padx=(0, SPACE_SM))
@@ -322,7 +988,7 @@ class ListEditorDialog:
             height=32,
             fg_color=SLATE_700,
             hover_color=ERROR,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self._delete_item,
         )
         self.delete_btn.pack(side="left")
@@ -335,7 +1001,7 @@ class ListEditorDialog:
             height=32,
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self._save,
         ).pack(side="right", padx=(SPACE_SM, 0))
 
@@ -346,43 +1012,128 @@ class ListEditorDialog:
             height=32,
             fg_color=SLATE_700,
             hover_color=SLATE_600,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self.dialog.destroy,
         ).pack(side="right")
 
     def _refresh_list(self):
-        """Refresh the list display."""
-        # Clear existing
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
-
-        # Add items
-        for i, item in enumerate(self.items):
-            row = ctk.CTkFrame(
-                self.list_frame,
-                fg_color=SLATE_700 if i == self.selected_index else "transparent",
-                corner_radius=4,
+        """Refresh the list display (re-renders only the visible rows)."""
+        for row in self._visible_rows.values():
+            self._release_row(row)
+        self._visible_rows.clear()
+
+        total_height = len(self.items) * LIST_ROW_HEIGHT
+        self.list_canvas.configure(scrollregion=(0, 0, self._viewport_width, total_height))
+        self._render_viewport()
+
+    def _schedule_refresh(self):
+        """Queue one list rebuild for the next idle cycle (coalesces mutations)."""
+        if self._refresh_pending is None:
+            self._refresh_pending = self.dialog.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run the queued list rebuild."""
+        self._refresh_pending = None
+        self._refresh_list()
+
+    def _render_viewport(self):
+        """Attach pooled rows to the items inside the visible canvas area."""
+        top = self.list_canvas.canvasy(0)
+        height = self.list_canvas.winfo_height()
+        first = max(0, int(top // LIST_ROW_HEIGHT) - LIST_OVERSCAN)
+        last = min(len(self.items), int((top + height) // LIST_ROW_HEIGHT) + 1 + LIST_OVERSCAN)
+
+        # Return rows that scrolled out of range to the pool
+        for index in [i for i in self._visible_rows if not first <= i < last]:
+            self._release_row(self._visible_rows.pop(index))
+
+        for index in range(first, last):
+            if index in self._visible_rows:
+                continue
+            row = self._row_pool.pop() if self._row_pool else self._create_row()
+            row.index = index
+            values = self._display_cache[index]
+            if values is None:
+                values = tuple(str(val) for val in self._get_display_values(self.items[index]))
+                self._display_cache[index] = values
+            for lbl, val in zip(row.labels, values):
+                lbl.configure(text=val)
+            row.frame.configure(fg_color=SLATE_700 if index == self.selected_index else "transparent")
+            self.list_canvas.coords(row.window_id, 0, index * LIST_ROW_HEIGHT + 1)
+            self.list_canvas.itemconfigure(row.window_id, state="normal")
+            self._visible_rows[index] = row
+
+    def _create_row(self):
+        """Create a row widget for the pool (frame + one label per column)."""
+        frame = ctk.CTkFrame(
+            self.list_canvas,
+            fg_color="transparent",
+            corner_radius=4,
+            height=LIST_ROW_HEIGHT - 2,
+        )
+        frame.pack_propagate(False)
+        window_id = self.list_canvas.create_window(
+            0, 0, window=frame, anchor="nw", width=self._viewport_width, state="hidden"
+        )
+        row = _ListRow(frame, window_id)
+        frame._list_row = row
+        frame.bind("<Button-1>", self._on_row_click)
+
+        for _ in self.columns:
+            lbl = ctk.CTkLabel(
+                frame,
+                text="",
+                width=self.col_width,
+                font=_font(13),
+                text_color=SLATE_200,
+                anchor="w",
             )
-            row.pack(fill="x", pady=1)
-            row.bind("<Button-1>", lambda e, idx=i: self._select_item(idx))
-
-            values = self._get_display_values(item)
-            for val in values:
-                lbl = ctk.CTkLabel(
-                    row,
-                    text=str(val),
-                    width=self.col_width,
-                    font=ctk.CTkFont(family=FONT_FAMILY, size=13),
-                    text_color=SLATE_200,
-                    anchor="w",
-                )
-                lbl.pack(side="left", padx=SPACE_SM, pady=SPACE_XS)
-                lbl.bind("<Button-1>", lambda e, idx=i: self._select_item(idx))
+            lbl.pack(**LIST_LABEL_PACK)
+            lbl.bind("<Button-1>", self._on_row_click)
+            row.labels.append(lbl)
+
+        return row
+
+    def _on_row_click(self, event):
+        """Select the item shown by the clicked row."""
+        frame = _tagged_ancestor(event.widget, "_list_row")
+        if frame is not None and frame._list_row.index is not None:
+            self._select_item(frame._list_row.index)
+
+    def _release_row(self, row):
+        """Hide a row and return it to the pool."""
+        self.list_canvas.itemconfigure(row.window_id, state="hidden")
+        row.index = None
+        self._row_pool.append(row)
+
+    def _on_list_scroll(self, first, last):
+        """Canvas view changed: update scrollbar and fill in newly visible rows."""
+        self.list_scrollbar.set(first, last)
+        self._render_viewport()
+
+    def _on_list_resize(self, event):
+        """Stretch rows to the canvas width and render the new viewport."""
+        self._viewport_width = event.width
+        for row in list(self._visible_rows.values()) + self._row_pool:
+            self.list_canvas.itemconfigure(row.window_id, width=event.width)
+        self.list_canvas.configure(
+            scrollregion=(0, 0, event.width, len(self.items) * LIST_ROW_HEIGHT)
+        )
+        self._render_viewport()
+
+    def _on_mousewheel(self, event):
+        """Scroll the list three rows per wheel notch."""
+        self.list_canvas.yview_scroll(-3 if event.delta > 0 else 3, "units")
 
     def _select_item(self, index):
-        """Select an item."""
+        """Select an item, recoloring only the old and new rows."""
+        previous = self._visible_rows.get(self.selected_index)
+        if previous is not None:
+            previous.frame.configure(fg_color="transparent")
         self.selected_index = index
-        self._refresh_list()
+        current = self._visible_rows.get(index)
+        if current is not None:
+            current.frame.configure(fg_color=SLATE_700)
 
     def _get_display_values(self, item):
         """Override in subclass to return display values for an item."""
@@ -396,12 +1147,28 @@ class ListEditorDialog:
         """Override in subclass to edit selected item."""
         raise NotImplementedError
 
+    def _store_item(self, index, item):
+        """
+        Replace the item at index, or append it when index is None.
+
+        Args:
+            index: Position of the item being edited, or None to add
+            item: New item value
+        """
+        if index is None:
+            self.items.append(item)
+            self._display_cache.append(None)
+        else:
+            self.items[index] = item
+            self._display_cache[index] = None  # Recomputed on next render
+
     def _delete_item(self):
         """Delete selected item."""
         if self.selected_index is not None and 0 <= self.selected_index < len(self.items):
             del self.items[self.selected_index]
+            del self._display_cache[self.selected_index]
             self.selected_index = None
-            self._refresh_list()
+            self._schedule_refresh()
 
     def _save(self):
         """Save and close."""
@@ -412,6 +1179,8 @@ class ListEditorDialog:
 class DictionaryEditor(ListEditorDialog):
     """Editor for custom word replacements."""
 
+    _ITEMS_ARE_DICTS = True
+
     def __init__(self, parent, items, on_save):
         super().__init__(
             parent,
@@ -449,7 +1218,7 @@ class DictionaryEditor(ListEditorDialog):
         frame.pack(fill="both", expand=True, padx=SPACE_LG, pady=SPACE_LG)
 
         # From field
-        ctk.CTkLabel(frame, text="From:", font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+        ctk.CTkLabel(frame, text="From:", font=_font(13),
                      text_color=SLATE_200).pack(anchor="w")
         from_var = ctk.StringVar(value=item.get("from", ""))
         from_entry = ctk.CTkEntry(frame, textvariable=from_var, width=300,
@@ -457,7 +1226,7 @@ class DictionaryEditor(ListEditorDialog):
         from_entry.pack(fill="x", pady=(SPACE_XS, SPACE_MD))
 
         # To field
-        ctk.CTkLabel(frame, text="To:", font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+        ctk.CTkLabel(frame, text="To:", font=_font(13),
                      text_color=SLATE_200).pack(anchor="w")
         to_var = ctk.StringVar(value=item.get("to", ""))
         to_entry = ctk.CTkEntry(frame, textvariable=to_var, width=300,
@@ -467,11 +1236,8 @@ class DictionaryEditor(ListEditorDialog):
         def save_entry():
             new_item = {"from": from_var.get(), "to": to_var.get(), "case_sensitive": False}
             if from_var.get():  # Only save if "from" is not empty
-                if is_edit:
-                    self.items[edit_index] = new_item
-                else:
-                    self.items.append(new_item)
-                self._refresh_list()
+                self._store_item(edit_index if is_edit else None, new_item)
+                self._schedule_refresh()
             dlg.destroy()
 
         btn_row = ctk.CTkFrame(frame, fg_color="transparent")
@@ -520,7 +1286,7 @@ class VocabularyEditor(ListEditorDialog):
         frame = ctk.CTkFrame(dlg, fg_color="transparent")
         frame.pack(fill="both", expand=True, padx=SPACE_LG, pady=SPACE_LG)
 
-        ctk.CTkLabel(frame, text="Word/Phrase:", font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+        ctk.CTkLabel(frame, text="Word/Phrase:", font=_font(13),
                      text_color=SLATE_200).pack(anchor="w")
         word_var = ctk.StringVar(value=word)
         word_entry = ctk.CTkEntry(frame, textvariable=word_var, width=300,
@@ -529,11 +1295,8 @@ class VocabularyEditor(ListEditorDialog):
 
         def save_entry():
             if word_var.get():
-                if is_edit:
-                    self.items[edit_index] = word_var.get()
-                else:
-                    self.items.append(word_var.get())
-                self._refresh_list()
+                self._store_item(edit_index if is_edit else None, word_var.get())
+                self._schedule_refresh()
             dlg.destroy()
 
         btn_row = ctk.CTkFrame(frame, fg_color="transparent")
@@ -548,6 +1311,8 @@ class VocabularyEditor(ListEditorDialog):
 class ShortcutsEditor(ListEditorDialog):
     """Editor for text shortcuts (trigger -> expansion)."""
 
+    _ITEMS_ARE_DICTS = True
+
     def __init__(self, parent, items, on_save):
         super().__init__(
             parent,
@@ -589,7 +1354,7 @@ class ShortcutsEditor(ListEditorDialog):
         frame.pack(fill="both", expand=True, padx=SPACE_LG, pady=SPACE_LG)
 
         # Trigger field
-        ctk.CTkLabel(frame, text="Trigger phrase:", font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+        ctk.CTkLabel(frame, text="Trigger phrase:", font=_font(13),
                      text_color=SLATE_200).pack(anchor="w")
         trigger_var = ctk.StringVar(value=item.get("trigger", ""))
         trigger_entry = ctk.CTkEntry(frame, textvariable=trigger_var, width=350,
@@ -597,7 +1362,7 @@ class ShortcutsEditor(ListEditorDialog):
         trigger_entry.pack(fill="x", pady=(SPACE_XS, SPACE_MD))
 
         # Replacement field
-        ctk.CTkLabel(frame, text="Replacement text:", font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+        ctk.CTkLabel(frame, text="Replacement text:", font=_font(13),
                      text_color=SLATE_200).pack(anchor="w")
         replacement_text = ctk.CTkTextbox(frame, width=350, height=80,
                                            fg_color=SLATE_800, border_color=SLATE_600)
@@ -611,11 +1376,8 @@ class ShortcutsEditor(ListEditorDialog):
                 "enabled": True,
             }
             if trigger_var.get():
-                if is_edit:
-                    self.items[edit_index] = new_item
-                else:
-                    self.items.append(new_item)
-                self._refresh_list()
+                self._store_item(edit_index if is_edit else None, new_item)
+                self._schedule_refresh()
             dlg.destroy()
 
         btn_row = ctk.CTkFrame(frame, fg_color="transparent")
@@ -635,10 +1397,9 @@ class HistoryViewer:
         Args:
             parent: Parent window
         """
-        import text_processor
-
         self.parent = parent
-        self.entries = text_processor.TranscriptionHistory.load_from_disk()
+        self.entries = []
+        self._loading = True  # History is read from disk in the background
 
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Transcription History")
@@ -648,13 +1409,31 @@ class HistoryViewer:
         self.dialog.grab_set()
 
         # Center on parent
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 600) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 450) // 2
-        self.dialog.geometry(f"+{x}+{y}")
+        _center_dialog(self.dialog, parent, 600, 450)
 
         self._create_ui()
 
+        thread = threading.Thread(target=self._load_history, daemon=True)
+        thread.start()
+
+    def _load_history(self):
+        """Read history from disk (background thread) and hand it to the UI thread."""
+        import text_processor
+
+        entries = text_processor.TranscriptionHistory.load_from_disk()
+        try:
+            self.dialog.after(0, self._on_history_loaded, entries)
+        except (RuntimeError, tk.TclError):
+            pass  # Dialog closed before the load finished
+
+    def _on_history_loaded(self, entries):
+        """Show the loaded history, unless the dialog was closed meanwhile."""
+        if not self.dialog.winfo_exists():
+            return
+        self._loading = False
+        self.entries = entries
+        self._populate_list()
+
     def _create_ui(self):
         """Create the dialog UI."""
         # Main container
@@ -665,7 +1444,7 @@ class HistoryViewer:
         title = ctk.CTkLabel(
             main,
             text="Recent Transcriptions",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=16, weight="bold"),
+            font=_font(16, "bold"),
             text_color=SLATE_100,
         )
         title.pack(anchor="w", pady=(0, SPACE_MD))
@@ -682,7 +1461,7 @@ class HistoryViewer:
             header,
             text="Time",
             width=120,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
+            font=_font(12, "bold"),
             text_color=SLATE_300,
             anchor="w",
         ).pack(side="left", padx=SPACE_SM, pady=SPACE_XS)
@@ -690,7 +1469,7 @@ class HistoryViewer:
         ctk.CTkLabel(
             header,
             text="Transcription",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12, weight="bold"),
+            font=_font(12, "bold"),
             text_color=SLATE_300,
             anchor="w",
         ).pack(side="left", fill="x", expand=True, padx=SPACE_SM, pady=SPACE_XS)
@@ -702,9 +1481,15 @@ class HistoryViewer:
             scrollbar_button_color=SLATE_600,
         )
         self.list_frame.pack(fill="both", expand=True, padx=2, pady=2)
+        self.list_frame._parent_canvas.configure(yscrollcommand=self._on_history_scroll)
+        self.list_frame.bind("<Configure>", self._on_list_configure, add="+")
 
         self.selected_index = None
         self.row_frames = []
+        self._row_pool = []  # Unpacked rows kept for reuse
+        self._empty_label = None
+        self._rendered = 0
+        self._page_pending = None
         self._populate_list()
 
         # Button row
@@ -718,7 +1503,7 @@ class HistoryViewer:
             height=32,
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self._copy_selected,
         ).pack(side="left", padx=(0, SPACE_SM))
 
@@ -729,7 +1514,7 @@ class HistoryViewer:
             height=32,
             fg_color=SLATE_700,
             hover_color=SLATE_600,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self._export_history,
         ).pack(side="left", padx=(0, SPACE_SM))
 
@@ -740,7 +1525,7 @@ class HistoryViewer:
             height=32,
             fg_color=SLATE_700,
             hover_color=ERROR,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self._clear_history,
         ).pack(side="left", padx=(0, SPACE_SM))
 
@@ -751,69 +1536,115 @@ class HistoryViewer:
             height=32,
             fg_color=SLATE_700,
             hover_color=SLATE_600,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=self.dialog.destroy,
         ).pack(side="right")
 
     def _populate_list(self):
-        """Populate the history list."""
-        # Clear existing
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
+        """Populate the history list with its first page of rows."""
+        # Unpack existing rows into the pool instead of destroying them
+        for row, _ in self.row_frames:
+            row.pack_forget()
+            row.configure(fg_color="transparent")
+            self._row_pool.append(row)
         self.row_frames = []
+        self.selected_index = None
+        self._rendered = 0
+        self._page_pending = None
 
         if not self.entries:
-            empty_label = ctk.CTkLabel(
-                self.list_frame,
-                text="No transcriptions yet",
-                font=ctk.CTkFont(family=FONT_FAMILY, size=13),
-                text_color=SLATE_400,
+            if self._empty_label is None:
+                self._empty_label = ctk.CTkLabel(
+                    self.list_frame,
+                    font=_font(13),
+                    text_color=SLATE_400,
+                )
+            self._empty_label.configure(
+                text="Loading..." if self._loading else "No transcriptions yet"
             )
-            empty_label.pack(pady=SPACE_LG)
+            self._empty_label.pack(pady=SPACE_LG)
             return
 
-        # Show newest first
-        for i, entry in enumerate(reversed(self.entries)):
-            row = ctk.CTkFrame(self.list_frame, fg_color="transparent", height=36)
+        if self._empty_label is not None:
+            self._empty_label.pack_forget()
+        self._render_next_page()
+
+    def _render_next_page(self):
+        """Append the next HISTORY_PAGE_SIZE rows (newest first) below the existing ones."""
+        self._page_pending = None
+        end = min(self._rendered + HISTORY_PAGE_SIZE, len(self.entries))
+
+        # Show newest first: display slot i holds entry n - 1 - i
+        n = len(self.entries)
+        for actual_index in range(n - 1 - self._rendered, n - 1 - end, -1):
+            entry = self.entries[actual_index]
+            row = self._row_pool.pop() if self._row_pool else self._create_row()
             row.pack(fill="x", pady=1)
-            row.pack_propagate(False)
-
-            # Time column
-            timestamp = entry.get("timestamp", "")[:16]  # YYYY-MM-DD HH:MM
-            time_lbl = ctk.CTkLabel(
-                row,
-                text=timestamp,
-                width=120,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=12),
-                text_color=SLATE_400,
-                anchor="w",
-            )
-            time_lbl.pack(side="left", padx=SPACE_SM)
+
+            time_lbl, text_lbl = row._labels
+            time_lbl.configure(text=entry.get("timestamp", "")[:16])  # YYYY-MM-DD HH:MM
 
             # Text column (truncated)
             text = entry.get("text", "").strip()
-            display_text = text[:60] + "..." if len(text) > 60 else text
-            text_lbl = ctk.CTkLabel(
-                row,
-                text=display_text,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=12),
-                text_color=SLATE_200,
-                anchor="w",
-            )
-            text_lbl.pack(side="left", fill="x", expand=True, padx=SPACE_SM)
+            text_lbl.configure(text=text[:60] + "..." if len(text) > 60 else text)
 
-            # Store index in reversed order
-            actual_index = len(self.entries) - 1 - i
+            row._history_index = actual_index
+            self.row_frames.append((row, actual_index))
 
-            # Click handler
-            def on_click(event, idx=actual_index, frame=row):
-                self._select_row(idx, frame)
+        self._rendered = end
 
-            row.bind("<Button-1>", on_click)
-            time_lbl.bind("<Button-1>", on_click)
-            text_lbl.bind("<Button-1>", on_click)
+    def _create_row(self):
+        """Create a history row (time + text labels) for the list."""
+        row = ctk.CTkFrame(self.list_frame, fg_color="transparent", height=36)
+        row.pack_propagate(False)
 
-            self.row_frames.append((row, actual_index))
+        # Time column
+        time_lbl = ctk.CTkLabel(
+            row,
+            text="",
+            width=120,
+            font=_font(12),
+            text_color=SLATE_400,
+            anchor="w",
+        )
+        time_lbl.pack(side="left", padx=SPACE_SM)
+
+        # Text column
+        text_lbl = ctk.CTkLabel(
+            row,
+            text="",
+            font=_font(12),
+            text_color=SLATE_200,
+            anchor="w",
+        )
+        text_lbl.pack(side="left", fill="x", expand=True, padx=SPACE_SM)
+
+        row._labels = (time_lbl, text_lbl)
+        row.bind("<Button-1>", self._on_row_click)
+        time_lbl.bind("<Button-1>", self._on_row_click)
+        text_lbl.bind("<Button-1>", self._on_row_click)
+        return row
+
+    def _on_history_scroll(self, first, last):
+        """Canvas view changed: update scrollbar and load more rows near the end."""
+        self.list_frame._scrollbar.set(first, last)
+        self._maybe_load_more(float(last))
+
+    def _on_list_configure(self, event):
+        """Inner frame resized: keep loading while the content doesn't fill the view."""
+        self._maybe_load_more(self.list_frame._parent_canvas.yview()[1])
+
+    def _maybe_load_more(self, view_bottom):
+        """Queue the next page once the view nears the bottom of the rendered rows."""
+        if (view_bottom > 0.9 and self._rendered < len(self.entries)
+                and self._page_pending is None):
+            self._page_pending = self.dialog.after_idle(self._render_next_page)
+
+    def _on_row_click(self, event):
+        """Select the history row that was clicked."""
+        frame = _tagged_ancestor(event.widget, "_history_index")
+        if frame is not None:
+            self._select_row(frame._history_index, frame)
 
     def _select_row(self, index, frame):
         """Select a row."""
@@ -839,6 +1670,9 @@ class HistoryViewer:
 
     def _export_history(self):
         """Export history to file."""
+        if self._loading:
+            messagebox.showinfo("Export", "History is still loading.")
+            return
         if not self.entries:
             messagebox.showinfo("Export", "No history to export.")
             return
@@ -852,10 +1686,7 @@ class HistoryViewer:
         format_dlg.grab_set()
 
         # Center on dialog
-        format_dlg.update_idletasks()
-        x = self.dialog.winfo_x() + (self.dialog.winfo_width() - 300) // 2
-        y = self.dialog.winfo_y() + (self.dialog.winfo_height() - 200) // 2
-        format_dlg.geometry(f"+{x}+{y}")
+        _center_dialog(format_dlg, self.dialog, 300, 200)
 
         frame = ctk.CTkFrame(format_dlg, fg_color="transparent")
         frame.pack(fill="both", expand=True, padx=SPACE_LG, pady=SPACE_LG)
@@ -863,7 +1694,7 @@ class HistoryViewer:
         ctk.CTkLabel(
             frame,
             text="Select export format:",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=SLATE_100,
         ).pack(anchor="w", pady=(0, SPACE_MD))
 
@@ -915,27 +1746,29 @@ class HistoryViewer:
         try:
             fmt = result["format"]
             if fmt == "txt":
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write("Transcription History\n")
-                    f.write("=" * 60 + "\n\n")
-                    for entry in self.entries:
-                        ts = entry.get("timestamp", "")
-                        text = entry.get("text", "")
-                        f.write(f"[{ts}]\n{text}\n\n")
+                with open(filename, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write("Transcription History\n" + "=" * 60 + "\n\n")
+                    f.writelines(
+                        f"[{entry.get('timestamp', '')}]\n{entry.get('text', '')}\n\n"
+                        for entry in self.entries
+                    )
             elif fmt == "csv":
                 import csv
-                with open(filename, "w", encoding="utf-8", newline="") as f:
+                with open(filename, "w", encoding="utf-8", newline="",
+                          buffering=EXPORT_BUFFER_SIZE) as f:
                     writer = csv.writer(f)
                     writer.writerow(["Timestamp", "Text", "Characters"])
                     for entry in self.entries:
-                        ts = entry.get("timestamp", "")
                         text = entry.get("text", "")
-                        char_count = entry.get("char_count", len(text))
-                        writer.writerow([ts, text, char_count])
+                        writer.writerow([entry.get("timestamp", ""), text, entry.get("char_count", len(text))])
             elif fmt == "json":
-                import json
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump({"entries": self.entries}, f, indent=2, ensure_ascii=False)
+                # One compact entry per line: keeps json's C encoder (indent=None)
+                # while the file stays line-diffable
+                encode = json.JSONEncoder(ensure_ascii=False).encode
+                with open(filename, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write('{"entries": [\n')
+                    f.write(",\n".join(map(encode, self.entries)))
+                    f.write("\n]}\n")
 
             messagebox.showinfo("Export Successful", f"History exported to:\n{filename}")
         except Exception as e:
@@ -943,6 +1776,9 @@ class HistoryViewer:
 
     def _clear_history(self):
         """Clear all history."""
+        if self._loading:
+            messagebox.showinfo("Clear History", "History is still loading.")
+            return
         if not self.entries:
             messagebox.showinfo("Clear History", "No history to clear.")
             return
@@ -958,19 +1794,78 @@ class HistoryViewer:
 class SettingsWindow:
     """Settings window matching the HTML mockup exactly."""
 
+    _NAV_ACTIVE_STYLE = {"fg_color": PRIMARY, "text_color": "white", "hover_color": PRIMARY_DARK}
+    _NAV_INACTIVE_STYLE = {"fg_color": "transparent", "text_color": SLATE_300, "hover_color": SLATE_700}
+    _VERSION_TEXT = f"MurmurTone v{config.VERSION}"
+    # (width, height, level_x) -> audio meter level PhotoImage; cleared with the Tk root
+    _GRADIENT_CACHE = {}
+    _SYS_INFO_CACHE = None  # About-tab system info text, probed once per process
+    # (variable attr, defaults key, display transform or None) applied by reset_defaults
+    _RESET_SPEC = (
+        # General tab
+        ("mode_var", "recording_mode", lambda v: RECORDING_MODE.fwd.get(v, "Push-to-Talk")),
+        ("lang_var", "language", lambda v: LANGUAGE.fwd.get(v, v)),
+        ("autopaste_var", "auto_paste", None),
+        ("paste_mode_var", "paste_mode", lambda v: PASTE_MODE.fwd.get(v, "Clipboard")),
+        ("preview_enabled_var", "preview_enabled", None),
+        ("preview_position_var", "preview_position", lambda v: PREVIEW_POSITION.fwd.get(v, "Bottom Right")),
+        ("preview_theme_var", "preview_theme", lambda v: PREVIEW_THEME.fwd.get(v, "Dark")),
+        ("preview_delay_var", "preview_auto_hide_delay", str),
+        ("preview_font_size_var", "preview_font_size", None),
+        ("startup_var", "start_with_windows", None),
+        # Audio tab
+        ("rate_var", "sample_rate", lambda v: SAMPLE_RATE.fwd.get(v, "16000 Hz")),
+        ("noise_gate_var", "noise_gate_enabled", None),
+        ("noise_threshold_var", "noise_gate_threshold_db", None),
+        ("feedback_var", "audio_feedback", None),
+        ("volume_var", "audio_feedback_volume", lambda v: int(v * 100)),
+        *((attr, key, None) for attr, key, _ in SOUND_CHECKBOXES),
+        # Recognition tab
+        ("model_var", "model_size", None),
+        ("_model_display_var", "model_size", lambda v: config.MODEL_DISPLAY_NAMES.get(v, v)),
+        ("silence_var", "silence_duration_sec", str),
+        ("processing_mode_var", "processing_mode", lambda v: PROCESSING_MODE.fwd.get(v, "Auto")),
+        ("translation_enabled_var", "translation_enabled", None),
+        ("trans_lang_var", "translation_source_language", lambda v: LANGUAGE.fwd.get(v, v)),
+        # Text tab
+        ("voice_commands_var", "voice_commands_enabled", None),
+        ("scratch_that_var", "scratch_that_enabled", None),
+        ("filler_var", "filler_removal_enabled", None),
+        ("filler_aggressive_var", "filler_removal_aggressive", None),
+        # Advanced tab
+        ("ai_cleanup_var", "ai_cleanup_enabled", None),
+        ("ai_mode_var", "ai_cleanup_mode", None),
+        ("ai_formality_var", "ai_formality_level", None),
+        ("ai_model_var", "ollama_model", None),
+    )
+
     def __init__(self, current_config, on_save_callback=None):
         self.config = current_config or {}
         self.on_save_callback = on_save_callback
         self.window = None
         self.nav_items = {}
+        self._active_nav_id = None  # Nav button currently styled as active
         self.nav_icons = {}  # Will hold CTkImage objects for nav icons
-        self.sections = {}
+        self.sections = {}  # Only the visible section is built (see _show_section)
         self.current_section = "general"
+        self._section_builders = {
+            "general": self._create_general_section,
+            "audio": self._create_audio_section,
+            "recognition": self._create_recognition_section,
+            "text": self._create_text_section,
+            "advanced": self._create_advanced_section,
+            "about": self._create_about_section,
+        }
 
         # Audio test state
         self.noise_test_running = False
         self.noise_stream = None
-        self.meter_gradient_photo = None  # Audio meter gradient image
+        self.audio_stream = None
+        self.meter_level_item = None  # Meter level image item on the Audio canvas
+        self._meter_pending = False  # A meter redraw is already scheduled
+        self._meter_last_db = -80.0  # Latest level from the audio callback
+        self._last_meter_x = -1  # Level column last drawn; -1 forces the next redraw
+        self._drag_last_x = None  # Threshold marker x during a drag
 
         # Custom data
         self.custom_dictionary = self.config.get("custom_dictionary", {})
@@ -978,17 +1873,47 @@ class SettingsWindow:
         self.custom_commands = self.config.get("custom_commands", {})
 
         # Autosave state (debounce managers initialized in show())
-        self._text_debounce = None
-        self._slider_debounce = None
+        self._autosave_debounce = None  # Toggles, dropdowns and sliders
+        self._text_debounce = None  # Typed entries (longer delay)
+        self._last_saved_config = None  # Last config written (set only after a successful write)
+        self._queued_config = None  # Last config handed to the writer, to skip no-op saves
+        # Config writes run on one background thread (stopped by close() with a
+        # None sentinel); at most one write waits.
+        # Results come back through _save_results (a config, or None on failure).
+        self._save_queue = queue.Queue(maxsize=1)
+        self._save_results = queue.Queue()
+        threading.Thread(target=self._save_worker, daemon=True).start()
         self._status_label = None
         self._status_hide_id = None
 
+        # Last status applied to the Recognition section's indicators
+        self._last_model_status = None
+        self._last_gpu_status = None
+        self._ollama_check_pending = False  # One Ollama "Check" request at a time
+
         # Lazy loading for About section
         self._sys_info_label = None
         self._sys_info_loaded = False
 
+        # Hotkey capture state (widgets created with the General section)
+        self.capturing = False
+        self.listener = None
+        self.hotkey_help_label = None
+        self.paste_help_label = None
+
+        # Confirm dialog (built on first use, then hidden and reused)
+        self._confirm_dlg = None
+        self._confirm_label = None
+        self._confirm_result = None
+
+        # GPU library install dialog (while an install is running)
+        self._install_dialog = None
+        self._install_progress = None
+        self._install_status = None
+
     def show(self):
         """Show the settings window."""
+        init_gui()
         self.window = ctk.CTk()
         self.window.title("MurmurTone Settings")
         self.window.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
@@ -998,32 +1923,26 @@ class SettingsWindow:
 
         # Try to set icon
         try:
-            icon_path = resource_path("icon.ico")
-            if os.path.exists(icon_path):
+            icon_path = _existing_resource("icon.ico")
+            if icon_path:
                 self.window.iconbitmap(icon_path)
         except Exception:
             pass
 
-        # Load navigation icons
-        self.nav_icons = load_nav_icons()
-
         # Initialize debounce managers for autosave
-        self._text_debounce = DebounceManager(self.window, self._autosave, delay_ms=1500)
-        self._slider_debounce = DebounceManager(self.window, self._autosave, delay_ms=300)
+        self._autosave_debounce = DebounceManager(self.window, self._autosave_now, delay_ms=300)
+        self._text_debounce = DebounceManager(self.window, self._autosave_now, delay_ms=1500)
+
+        # Setting values live in Tk variables that outlive section widgets
+        self._create_variables()
+        # Settings as opened; saves (and close()) only write when they differ
+        self._last_saved_config = self._queued_config = self._build_config_dict()
 
         # Build UI
         self._create_sidebar()
         self._create_content_area()
 
-        # Create all sections
-        self._create_general_section()
-        self._create_audio_section()
-        self._create_recognition_section()
-        self._create_text_section()
-        self._create_advanced_section()
-        self._create_about_section()
-
-        # Show initial section
+        # Show initial section (others are built when first selected)
         self._show_section("general")
 
         # Ensure window is visible and focused
@@ -1042,13 +1961,19 @@ class SettingsWindow:
         # Force window to be visible
         self.window.state('normal')  # Ensure not minimized/maximized
         self.window.deiconify()
-        self.window.update()
-
-        # Force to front (Windows-specific)
-        self.window.attributes('-topmost', True)
+        self.window.update_idletasks()  # Layout only; mainloop pumps the events
         self.window.lift()
         self.window.focus_force()
-        self.window.after(200, lambda: self.window.attributes('-topmost', False))
+
+        # Force to front (Windows-specific) once geometry has settled
+        def raise_to_front():
+            self.window.attributes('-topmost', True)
+            self.window.after(200, self.window.attributes, '-topmost', False)
+
+        self.window.after_idle(raise_to_front)
+
+        # Nav icons are decoded once the window is up; buttons start text-only
+        self.window.after_idle(self._load_nav_icons)
 
         # Setup keyboard navigation for accessibility
         self._setup_keyboard_navigation()
@@ -1056,6 +1981,86 @@ class SettingsWindow:
         self.window.protocol("WM_DELETE_WINDOW", self.close)
         self.window.mainloop()
 
+    def _create_variables(self):
+        """Create the Tk variables backing every setting from the loaded config."""
+        cfg = self.config
+
+        # General
+        self.hotkey = cfg.get("hotkey", "scroll_lock")
+        self.mode_var = ctk.StringVar(
+            value=RECORDING_MODE.fwd.get(cfg.get("recording_mode", "push_to_talk"), "Push-to-Talk")
+        )
+        lang_code = cfg.get("language", "auto")
+        self.lang_var = ctk.StringVar(value=LANGUAGE.fwd.get(lang_code, lang_code))
+        self.autopaste_var = ctk.BooleanVar(value=cfg.get("auto_paste", True))
+        self.paste_mode_var = ctk.StringVar(
+            value=PASTE_MODE.fwd.get(cfg.get("paste_mode", "clipboard"), "Clipboard")
+        )
+        self.preview_enabled_var = ctk.BooleanVar(value=cfg.get("preview_enabled", True))
+        self.preview_position_var = ctk.StringVar(
+            value=PREVIEW_POSITION.fwd.get(cfg.get("preview_position", "bottom_right"), "Bottom Right")
+        )
+        self.preview_theme_var = ctk.StringVar(
+            value=PREVIEW_THEME.fwd.get(cfg.get("preview_theme", "dark"), "Dark")
+        )
+        self.preview_delay_var = ctk.StringVar(value=str(cfg.get("preview_auto_hide_delay", 2.0)))
+        self.preview_font_size_var = ctk.IntVar(value=cfg.get("preview_font_size", 11))
+        self.startup_var = ctk.BooleanVar(value=cfg.get("start_with_windows", False))
+
+        # Audio
+        self.devices_list = settings_logic.get_input_devices()
+        self.device_var = ctk.StringVar(
+            value=settings_logic.get_device_display_name(cfg.get("input_device"), self.devices_list)
+        )
+        self.rate_var = ctk.StringVar(
+            value=SAMPLE_RATE.fwd.get(cfg.get("sample_rate", 16000), SAMPLE_RATE.fwd[16000])
+        )
+        self.noise_gate_var = ctk.BooleanVar(value=cfg.get("noise_gate_enabled", False))
+        self.noise_threshold_var = ctk.IntVar(value=cfg.get("noise_gate_threshold_db", -40))
+        self.meter_width = 300
+        self.meter_height = 20
+        self.feedback_var = ctk.BooleanVar(value=cfg.get("audio_feedback", True))
+        for attr, key, _ in SOUND_CHECKBOXES:
+            setattr(self, attr, ctk.BooleanVar(value=cfg.get(key, True)))
+        self.volume_var = ctk.IntVar(value=cfg.get("audio_feedback_volume", 100))
+
+        # Recognition: model_var holds the internal name (tiny, base, etc.),
+        # the dropdown shows friendly names (Quick, Standard, etc.)
+        initial_model = cfg.get("model_size", "tiny")
+        self.model_var = ctk.StringVar(value=initial_model)
+        self._model_display_var = ctk.StringVar(
+            value=config.MODEL_DISPLAY_NAMES.get(initial_model, initial_model)
+        )
+        self.silence_var = ctk.StringVar(value=str(cfg.get("silence_duration_sec", 2.0)))
+        self.processing_mode_var = ctk.StringVar(
+            value=PROCESSING_MODE.fwd.get(cfg.get("processing_mode", "auto"), "Auto")
+        )
+        self.translation_enabled_var = ctk.BooleanVar(value=cfg.get("translation_enabled", False))
+        trans_lang_code = cfg.get("translation_source_language", "auto")
+        self.trans_lang_var = ctk.StringVar(value=LANGUAGE.fwd.get(trans_lang_code, trans_lang_code))
+
+        # Text
+        self.voice_commands_var = ctk.BooleanVar(value=cfg.get("voice_commands_enabled", True))
+        self.scratch_that_var = ctk.BooleanVar(value=cfg.get("scratch_that_enabled", True))
+        self.filler_var = ctk.BooleanVar(value=cfg.get("filler_removal_enabled", False))
+        self.filler_aggressive_var = ctk.BooleanVar(value=cfg.get("filler_removal_aggressive", False))
+
+        # Advanced
+        self.ai_cleanup_var = ctk.BooleanVar(value=cfg.get("ai_cleanup_enabled", False))
+        self.ai_mode_var = ctk.StringVar(value=cfg.get("ai_cleanup_mode", "grammar"))
+        self.ai_formality_var = ctk.StringVar(value=cfg.get("ai_formality_level", "professional"))
+        self.ai_model_var = ctk.StringVar(value=cfg.get("ollama_model", "llama3.2"))
+
+        # Traces are added once here so rebuilding a section doesn't stack them
+        self.volume_var.trace_add("write", self._on_volume_changed)
+
+    def _on_volume_changed(self, *args):
+        """Update the volume readout (if the Audio section is built) and autosave."""
+        if "audio" in self.sections:
+            self.volume_label.configure(text=f"{self.volume_var.get()}%")
+        # Schedule debounced autosave
+        self._autosave()
+
     def _create_sidebar(self):
         """Create sidebar - matches mockup exactly."""
         self.sidebar = ctk.CTkFrame(
@@ -1071,7 +2076,7 @@ class SettingsWindow:
         title = ctk.CTkLabel(
             self.sidebar,
             text="Settings",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color=SLATE_100,
             anchor="w",
         )
@@ -1088,8 +2093,7 @@ class SettingsWindow:
         ]
 
         for section_id, label in nav_items_data:
-            icon = self.nav_icons.get(section_id)
-            self._add_nav_item(section_id, label, icon)
+            self._add_nav_item(section_id, label, self.nav_icons.get(section_id))
 
         # Spacer
         ctk.CTkFrame(self.sidebar, fg_color="transparent").pack(fill="both", expand=True)
@@ -1102,7 +2106,7 @@ class SettingsWindow:
         self._status_label = ctk.CTkLabel(
             self.sidebar,
             text="",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=_font(11),
             text_color=SUCCESS,
             anchor="w",
             height=16,
@@ -1112,8 +2116,8 @@ class SettingsWindow:
         # Version text - 11px, SLATE_500
         version = ctk.CTkLabel(
             self.sidebar,
-            text=f"MurmurTone v{config.VERSION}",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            text=self._VERSION_TEXT,
+            font=_font(11),
             text_color=SLATE_500,
             anchor="w",
         )
@@ -1126,7 +2130,7 @@ class SettingsWindow:
             text=label,
             image=icon,  # CTkImage object
             compound="left",  # Icon on the left of text
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             anchor="w",
             height=36,
             corner_radius=8,
@@ -1138,6 +2142,16 @@ class SettingsWindow:
         btn.pack(fill="x", padx=SPACE_MD, pady=2)
         self.nav_items[section_id] = btn
 
+    def _load_nav_icons(self):
+        """Load nav icons and add them to the already-visible sidebar buttons."""
+        if not self.window or not self.window.winfo_exists():
+            return
+        self.nav_icons = load_nav_icons()
+        for section_id, icon in self.nav_icons.items():
+            btn = self.nav_items.get(section_id)
+            if icon is not None and btn is not None:
+                btn.configure(image=icon)
+
     def _create_content_area(self):
         """Create content area - matches mockup exactly."""
         self.content_area = ctk.CTkFrame(
@@ -1158,7 +2172,7 @@ class SettingsWindow:
         self.page_title = ctk.CTkLabel(
             header_row,
             text="General",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color=SLATE_100,
             anchor="w",
         )
@@ -1181,18 +2195,23 @@ class SettingsWindow:
 
     def _show_section(self, section_id):
         """Show a specific section."""
-        # Update nav item states
-        for nav_id, btn in self.nav_items.items():
-            if nav_id == section_id:
-                btn.configure(fg_color=PRIMARY, text_color="white", hover_color=PRIMARY_DARK)
-            else:
-                btn.configure(fg_color="transparent", text_color=SLATE_300, hover_color=SLATE_700)
-
-        # Hide all sections
-        for section in self.sections.values():
-            section.pack_forget()
-
-        # Show selected section
+        # Update nav item states: only the old and new active buttons change
+        if section_id != self._active_nav_id:
+            if self._active_nav_id in self.nav_items:
+                self.nav_items[self._active_nav_id].configure(**self._NAV_INACTIVE_STYLE)
+            if section_id in self.nav_items:
+                self.nav_items[section_id].configure(**self._NAV_ACTIVE_STYLE)
+            self._active_nav_id = section_id
+
+        # Tear down the other built sections; only the visible one stays alive
+        for other_id in [sid for sid in self.sections if sid != section_id]:
+            self._destroy_section(other_id)
+
+        # Build (if needed) and show selected section. Builders fill the section
+        # frame while it is still unmapped and it is packed once afterwards, so
+        # Tk lays the whole section out in a single idle-time geometry pass.
+        if section_id not in self.sections and section_id in self._section_builders:
+            self._section_builders[section_id]()
         if section_id in self.sections:
             self.sections[section_id].pack(fill="both", expand=True)
             # Reset scroll position to top when switching tabs
@@ -1214,6 +2233,20 @@ class SettingsWindow:
         if section_id == "about" and not self._sys_info_loaded:
             self.window.after(10, self._populate_system_info)
 
+    def _destroy_section(self, section_id):
+        """Stop anything driving a section's widgets, then destroy it."""
+        if section_id == "general" and self.capturing:
+            self._stop_hotkey_capture()
+        elif section_id == "audio" and self.noise_test_running:
+            self.stop_noise_test()
+        elif section_id == "recognition":
+            self._last_model_status = self._last_gpu_status = None
+        elif section_id == "about":
+            self._sys_info_label = None
+            self._sys_info_loaded = False
+
+        self.sections.pop(section_id).destroy()
+
     # =========================================================================
     # SECTION BUILDERS
     # =========================================================================
@@ -1223,8 +2256,7 @@ class SettingsWindow:
 
         Returns a frame for adding controls to.
         """
-        container = ctk.CTkFrame(parent, fg_color="transparent")
-        container.pack(fill="x", pady=(0, SPACE_MD))
+        container = _plain_frame(parent, fill="x", pady=(0, SPACE_MD))
 
         # Optional divider line above section
         if show_divider:
@@ -1236,7 +2268,7 @@ class SettingsWindow:
             header = ctk.CTkLabel(
                 container,
                 text=title,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+                font=_font(14, "bold"),
                 text_color=SLATE_200,
                 anchor="w",
             )
@@ -1247,22 +2279,20 @@ class SettingsWindow:
             desc = ctk.CTkLabel(
                 container,
                 text=description,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+                font=_font(12),
                 text_color=SLATE_400,
                 anchor="w",
             )
             desc.pack(fill="x", pady=(SPACE_XS, 0))
 
         # Content frame with proper spacing
-        content = ctk.CTkFrame(container, fg_color="transparent")
-        content.pack(fill="x", pady=(SPACE_SM, SPACE_SM))
+        content = _plain_frame(container, fill="x", pady=(SPACE_SM, SPACE_SM))
 
         return content
 
     def _create_toggle_setting(self, parent, label, help_text=None, variable=None, command=None):
         """Create toggle setting matching mockup: [toggle] [label + help on right]."""
-        row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", pady=(0, SPACE_SM))
+        row = _plain_frame(parent, fill="x", pady=(0, SPACE_SM))
 
         # Wrap command to include autosave
         def on_toggle():
@@ -1289,14 +2319,13 @@ class SettingsWindow:
         switch.pack(side="left", anchor="n", pady=(2, 0))
 
         # Text content on right
-        text_frame = ctk.CTkFrame(row, fg_color="transparent")
-        text_frame.pack(side="left", anchor="n", padx=(SPACE_MD, 0), fill="x", expand=True)
+        text_frame = _plain_frame(row, side="left", anchor="n", padx=(SPACE_MD, 0), fill="x", expand=True)
 
         # Label - 13px, SLATE_200, tight height
         lbl = ctk.CTkLabel(
             text_frame,
             text=label,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             anchor="w",
             height=16,
@@ -1308,7 +2337,7 @@ class SettingsWindow:
             help_lbl = ctk.CTkLabel(
                 text_frame,
                 text=help_text,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+                font=_font(11),
                 text_color=SLATE_500,
                 anchor="w",
                 height=14,
@@ -1317,16 +2346,20 @@ class SettingsWindow:
 
         return switch
 
-    def _create_labeled_dropdown(self, parent, label, values, variable, help_text=None, width=160, command=None):
-        """Create labeled dropdown: label above, dropdown below, help below."""
-        container = ctk.CTkFrame(parent, fg_color="transparent")
-        container.pack(fill="x", pady=(0, SPACE_SM))
+    def _create_labeled_dropdown(self, parent, label, values, variable, help_text=None, width=160,
+                                 command=None, searchable=False):
+        """Create labeled dropdown: label above, dropdown below, help below.
+
+        Long lists pass searchable=True to get a SearchableDropdown instead of
+        a CTkComboBox.
+        """
+        container = _plain_frame(parent, fill="x", pady=(0, SPACE_SM))
 
         # Label - 13px, SLATE_200
         lbl = ctk.CTkLabel(
             container,
             text=label,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             anchor="w",
         )
@@ -1339,30 +2372,40 @@ class SettingsWindow:
             self._autosave()
 
         # Dropdown - matches mockup styling
-        dropdown = ctk.CTkComboBox(
-            container,
-            values=values,
-            variable=variable,
-            command=on_dropdown_change,
-            width=width,
-            height=36,
-            corner_radius=12,
-            border_width=1,
-            fg_color=SLATE_800,
-            border_color=SLATE_600,
-            button_color=SLATE_700,
-            button_hover_color=SLATE_600,
-            dropdown_fg_color=SLATE_700,
-            dropdown_hover_color=SLATE_600,
-            dropdown_text_color=SLATE_200,
-            text_color=SLATE_200,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
-            state="readonly",
-        )
-        dropdown.pack(anchor="w", pady=(SPACE_XS, 0))
+        if searchable:
+            dropdown = SearchableDropdown(
+                container,
+                values=values,
+                variable=variable,
+                command=on_dropdown_change,
+                width=width,
+            )
+            dropdown.pack(anchor="w", pady=(SPACE_XS, 0))
+        else:
+            dropdown = ctk.CTkComboBox(
+                container,
+                values=values,
+                variable=variable,
+                command=on_dropdown_change,
+                width=width,
+                height=36,
+                corner_radius=12,
+                border_width=1,
+                fg_color=SLATE_800,
+                border_color=SLATE_600,
+                button_color=SLATE_700,
+                button_hover_color=SLATE_600,
+                dropdown_fg_color=SLATE_700,
+                dropdown_hover_color=SLATE_600,
+                dropdown_text_color=SLATE_200,
+                text_color=SLATE_200,
+                font=_font(13),
+                state="readonly",
+            )
+            dropdown.pack(anchor="w", pady=(SPACE_XS, 0))
 
-        # Add toggle behavior, hand cursor, and make entire combobox clickable
-        make_combobox_clickable(dropdown)
+            # Add toggle behavior, hand cursor, and make entire combobox clickable
+            make_combobox_clickable(dropdown)
 
         # Help text
         help_lbl = None
@@ -1370,7 +2413,7 @@ class SettingsWindow:
             help_lbl = ctk.CTkLabel(
                 container,
                 text=help_text,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+                font=_font(11),
                 text_color=SLATE_500,
                 anchor="w",
             )
@@ -1380,14 +2423,13 @@ class SettingsWindow:
 
     def _create_labeled_entry(self, parent, label, variable, help_text=None, width=80):
         """Create labeled entry: label above, entry below, help below."""
-        container = ctk.CTkFrame(parent, fg_color="transparent")
-        container.pack(fill="x", pady=(0, SPACE_SM))
+        container = _plain_frame(parent, fill="x", pady=(0, SPACE_SM))
 
         # Label
         lbl = ctk.CTkLabel(
             container,
             text=label,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             anchor="w",
         )
@@ -1404,27 +2446,22 @@ class SettingsWindow:
             fg_color=SLATE_800,
             border_color=SLATE_600,
             text_color=SLATE_200,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
         )
         entry.pack(anchor="w", pady=(SPACE_XS, 0))
 
-        # Debounced autosave on text change
-        def on_entry_change(*args):
-            self._text_debounce.schedule()
-
-        def on_focus_out(event):
-            self._text_debounce.flush()
-
-        variable.trace_add("write", on_entry_change)
-        entry.bind("<FocusOut>", on_focus_out)
-        entry.bind("<Return>", lambda e: self._text_debounce.flush())
+        # Debounced autosave on typing only, so programmatic set() calls don't
+        # autosave; leaving the entry flushes immediately
+        entry.bind("<KeyRelease>", self._on_entry_typed)
+        entry.bind("<FocusOut>", self._on_entry_done)
+        entry.bind("<Return>", self._on_entry_done)
 
         # Help text
         if help_text:
             help_lbl = ctk.CTkLabel(
                 container,
                 text=help_text,
-                font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+                font=_font(11),
                 text_color=SLATE_500,
                 anchor="w",
             )
@@ -1432,10 +2469,23 @@ class SettingsWindow:
 
         return entry
 
+    def _on_entry_typed(self, event):
+        """Schedule a debounced autosave (shared by all labeled entries)."""
+        if not self._text_debounce.pending:
+            self._show_save_status("saving")
+        self._text_debounce.schedule()
+
+    def _on_entry_done(self, event):
+        """Save entry edits now (focus left or Return pressed).
+
+        Pastes and undo don't fire <KeyRelease>, so this saves directly instead
+        of flushing the debouncer; _autosave_now cancels it and skips no-op saves.
+        """
+        self._autosave_now()
+
     def _create_checkbox_setting(self, parent, label, variable, command=None):
         """Create checkbox setting matching mockup."""
-        row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", pady=(0, SPACE_SM))
+        row = _plain_frame(parent, fill="x", pady=(0, SPACE_SM))
 
         # Wrap command to include autosave
         def on_checkbox():
@@ -1448,7 +2498,7 @@ class SettingsWindow:
             text=label,
             variable=variable,
             command=on_checkbox,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
@@ -1465,14 +2515,13 @@ class SettingsWindow:
 
     def _create_hotkey_button(self, parent, initial_hotkey):
         """Create hotkey button matching mockup: [badge] Change."""
-        container = ctk.CTkFrame(parent, fg_color="transparent")
-        container.pack(fill="x", pady=(0, SPACE_SM))
+        container = _plain_frame(parent, fill="x", pady=(0, SPACE_SM))
 
         # Label above
         lbl = ctk.CTkLabel(
             container,
             text="Push-to-Talk Hotkey",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             anchor="w",
         )
@@ -1488,39 +2537,58 @@ class SettingsWindow:
         )
         btn_frame.pack(anchor="w", pady=(SPACE_XS, 0))
 
-        inner = ctk.CTkFrame(btn_frame, fg_color="transparent")
-        inner.pack(padx=SPACE_LG, pady=SPACE_SM)
-
-        # Hotkey badge
+        # Hotkey badge (badge and label sit directly in the bordered frame)
         self.hotkey_badge = ctk.CTkLabel(
-            inner,
+            btn_frame,
             text=self._format_hotkey(initial_hotkey),
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=_font(12, family=MONO_FONT_FAMILY),
             text_color=SLATE_300,
             fg_color=SLATE_700,
             corner_radius=8,
             padx=8,
             pady=2,
         )
-        self.hotkey_badge.pack(side="left")
+        self.hotkey_badge.pack(side="left", padx=(SPACE_LG, 0), pady=SPACE_SM)
 
         # "Change" text
         change_lbl = ctk.CTkLabel(
-            inner,
+            btn_frame,
             text="Change",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
         )
-        change_lbl.pack(side="left", padx=(SPACE_SM, 0))
+        change_lbl.pack(side="left", padx=(SPACE_SM, SPACE_LG), pady=SPACE_SM)
 
         # Make clickable
-        self.hotkey = initial_hotkey
         self.capturing = False
-        for widget in [btn_frame, inner, self.hotkey_badge, change_lbl]:
+
+        def on_click(event):
+            self._start_hotkey_capture()
+
+        for widget in [btn_frame, self.hotkey_badge, change_lbl]:
             widget.configure(cursor="hand2")
-            widget.bind("<Button-1>", lambda e: self._start_hotkey_capture())
-            widget.bind("<Enter>", lambda e: btn_frame.configure(fg_color=SLATE_700, border_color=SLATE_500))
-            widget.bind("<Leave>", lambda e: btn_frame.configure(fg_color=SLATE_800, border_color=SLATE_600) if not self.capturing else None)
+            widget.bind("<Button-1>", on_click)
+
+        # Hover is tracked on the outer frame only; moving onto the badge or
+        # label inside it isn't treated as leaving the button
+        frame_path = str(btn_frame)
+        hovered = [False]
+
+        def on_enter(event):
+            if not hovered[0]:
+                hovered[0] = True
+                btn_frame.configure(fg_color=SLATE_700, border_color=SLATE_500)
+
+        def on_leave(event):
+            under = str(btn_frame.winfo_containing(event.x_root, event.y_root) or "")
+            if under == frame_path or under.startswith(frame_path + "."):
+                return
+            hovered[0] = False
+            if not self.capturing:
+                btn_frame.configure(fg_color=SLATE_800, border_color=SLATE_600)
+
+        btn_frame.bind("<Enter>", on_enter)
+        btn_frame.bind("<Leave>", on_leave)
 
         self.hotkey_btn_frame = btn_frame
 
@@ -1528,7 +2596,7 @@ class SettingsWindow:
         self.hotkey_help_label = ctk.CTkLabel(
             container,
             text="Press and hold to record audio",  # Default, updated by _update_hotkey_help_text
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=_font(11),
             text_color=SLATE_500,
             anchor="w",
         )
@@ -1536,41 +2604,28 @@ class SettingsWindow:
 
     def _format_hotkey(self, hotkey):
         """Format hotkey for display."""
-        if not hotkey:
-            return "Not set"
-        if isinstance(hotkey, dict):
+        if hotkey and isinstance(hotkey, dict):
             return config.hotkey_to_string(hotkey)
-        parts = hotkey.split("+")
-        formatted = [p.replace("_", " ").title() for p in parts]
-        return " + ".join(formatted)
+        return _format_hotkey_str(hotkey or "")
 
     def _update_hotkey_help_text(self, mode_label=None):
         """Update hotkey help text based on recording mode."""
         if mode_label is None:
-            mode_label = self.mode_var.get() if hasattr(self, 'mode_var') else "Push-to-Talk"
+            mode_label = self.mode_var.get()
 
-        help_texts = {
-            "Push-to-Talk": "Press and hold to record audio",
-            "Toggle": "Press to start recording, press again to stop",
-            "Auto-stop": "Press to start recording, stops after silence",
-        }
-        text = help_texts.get(mode_label, "Press and hold to record audio")
+        text = _HOTKEY_HELP_TEXTS.get(mode_label, "Press and hold to record audio")
 
-        if hasattr(self, 'hotkey_help_label'):
+        if "general" in self.sections:
             self.hotkey_help_label.configure(text=text)
 
     def _update_paste_help_text(self, mode_label=None):
         """Update paste method help text based on selected mode."""
         if mode_label is None:
-            mode_label = self.paste_mode_var.get() if hasattr(self, 'paste_mode_var') else "Clipboard"
+            mode_label = self.paste_mode_var.get()
 
-        help_texts = {
-            "Clipboard": "Copies text to clipboard and pastes with Ctrl+V",
-            "Type": "Simulates typing each character (slower but more compatible)",
-        }
-        text = help_texts.get(mode_label, "How text is inserted")
+        text = _PASTE_HELP_TEXTS.get(mode_label, "How text is inserted")
 
-        if hasattr(self, 'paste_help_label') and self.paste_help_label:
+        if "general" in self.sections and self.paste_help_label is not None:
             self.paste_help_label.configure(text=text)
 
     def _start_hotkey_capture(self):
@@ -1581,35 +2636,39 @@ class SettingsWindow:
         self.hotkey_btn_frame.configure(fg_color=PRIMARY, border_color=PRIMARY)
         self.hotkey_badge.configure(text="Press any key...")
 
+        if self.listener is not None:
+            return  # Keyboard hook already installed; on_press now routes here
+
         try:
             from pynput import keyboard
-
-            def on_press(key):
-                try:
-                    if hasattr(key, "char") and key.char:
-                        key_name = key.char.lower()
-                    else:
-                        key_name = key.name.lower()
-                    self.hotkey = key_name
-                    self.hotkey_badge.configure(text=self._format_hotkey(key_name))
-                except AttributeError:
-                    pass
-                self._stop_hotkey_capture()
-                return False
-
-            self.listener = keyboard.Listener(on_press=on_press)
-            self.listener.start()
         except ImportError:
             self.hotkey_badge.configure(text="pynput not installed")
             self._stop_hotkey_capture()
+            return
+
+        # One listener is kept for the lifetime of the window; keys pressed
+        # outside a capture are ignored
+        def on_press(key):
+            if not self.capturing:
+                return
+            try:
+                if hasattr(key, "char") and key.char:
+                    key_name = key.char.lower()
+                else:
+                    key_name = key.name.lower()
+                self.hotkey = key_name
+                self.hotkey_badge.configure(text=self._format_hotkey(key_name))
+            except AttributeError:
+                pass
+            self._stop_hotkey_capture()
+
+        self.listener = keyboard.Listener(on_press=on_press)
+        self.listener.start()
 
     def _stop_hotkey_capture(self):
-        """Stop capturing."""
+        """Stop capturing (the keyboard listener stays installed until close)."""
         self.capturing = False
         self.hotkey_btn_frame.configure(fg_color=SLATE_800, border_color=SLATE_600)
-        if hasattr(self, 'listener') and self.listener:
-            self.listener.stop()
-            self.listener = None
         # Autosave after hotkey capture (use after() to ensure main thread)
         if self.window:
             self.window.after(100, self._autosave)
@@ -1638,47 +2697,36 @@ class SettingsWindow:
             border_color=border,
             border_width=1,
             text_color=text_color,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             command=command,
         )
         return btn
 
     def _create_status_dot(self, parent, color=SLATE_500):
         """Create a circular status indicator matching mockup spec (10px circle)."""
-        dot = ctk.CTkFrame(
-            parent,
-            width=10,
-            height=10,
-            corner_radius=5,  # Circle: radius = width/2
-            fg_color=color,
-        )
-        dot.pack_propagate(False)  # Maintain exact size
-        dot.pack(side="left", padx=(0, SPACE_XS))  # Add space after dot
-        return dot
-
-    def _create_meter_gradient(self, width, height):
-        """Create gradient image for audio meter (green → orange → red)."""
-        from PIL import Image, ImageDraw, ImageTk
-
-        img = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(img)
-
-        # Draw gradient: green -> orange -> red (matches mockup line 575)
-        for x in range(width):
-            if x < width * 0.7:  # 0-70%: green (#10b981) to orange (#f59e0b)
-                ratio = x / (width * 0.7)
-                r = int(16 + (245 - 16) * ratio)
-                g = int(185 + (158 - 185) * ratio)
-                b = int(129 + (11 - 129) * ratio)
-            else:  # 70-100%: orange to red (#ef4444)
-                ratio = (x - width * 0.7) / (width * 0.3)
-                r = int(245 + (239 - 245) * ratio)
-                g = int(158 + (68 - 158) * ratio)
-                b = int(11 + (68 - 11) * ratio)
-
-            draw.line([(x, 0), (x, height)], fill=(r, g, b))
-
-        return ImageTk.PhotoImage(img)
+        return _StatusDot(parent, color)
+
+    def _meter_frame(self, level_x):
+        """Meter image lit (green → orange → red) from the left edge to level_x.
+
+        Columns right of the level show the idle SLATE_800 background, so one
+        canvas image item draws the whole meter. Images are cached per size
+        and level on the class; only levels actually reached get composited.
+        """
+        width, height = self.meter_width, self.meter_height
+        key = (width, height, level_x)
+        cached = SettingsWindow._GRADIENT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        from PIL import ImageTk
+
+        row = _meter_gradient_row(width).copy()
+        row[level_x:] = SLATE_800_RGB
+        pixels = np.ascontiguousarray(np.broadcast_to(row, (height, width, 3)))
+        photo = ImageTk.PhotoImage(Image.fromarray(pixels))
+        SettingsWindow._GRADIENT_CACHE[key] = photo
+        return photo
 
     # =========================================================================
     # GENERAL SECTION
@@ -1693,15 +2741,13 @@ class SettingsWindow:
         recording = self._create_section_header(section, "Recording", "Configure how voice recording works")
 
         # Hotkey
-        self._create_hotkey_button(recording, self.config.get("hotkey", "scroll_lock"))
+        self._create_hotkey_button(recording, self.hotkey)
 
         # Recording mode (use display labels)
-        mode_value = self.config.get("recording_mode", "push_to_talk")
-        self.mode_var = ctk.StringVar(value=RECORDING_MODE_LABELS.get(mode_value, "Push-to-Talk"))
         self._create_labeled_dropdown(
             recording,
             "Recording Mode",
-            values=list(RECORDING_MODE_LABELS.values()),
+            values=RECORDING_MODE.labels,
             variable=self.mode_var,
             help_text="How recording starts and stops",
             width=160,
@@ -1711,23 +2757,20 @@ class SettingsWindow:
         self._update_hotkey_help_text()
 
         # Language
-        self.lang_var = ctk.StringVar(
-            value=settings_logic.language_code_to_label(self.config.get("language", "auto"))
-        )
         self._create_labeled_dropdown(
             recording,
             "Language",
-            values=settings_logic.get_language_labels(),
+            values=LANGUAGE.labels,
             variable=self.lang_var,
             help_text="Primary transcription language",
             width=160,
+            searchable=True,
         )
 
         # Output section
         output = self._create_section_header(section, "Output", "Control what happens with transcribed text", show_divider=True)
 
         # Auto-paste toggle
-        self.autopaste_var = ctk.BooleanVar(value=self.config.get("auto_paste", True))
         self._create_toggle_setting(
             output,
             "Auto-paste transcribed text",
@@ -1736,12 +2779,10 @@ class SettingsWindow:
         )
 
         # Paste method (use display labels)
-        paste_value = self.config.get("paste_mode", "clipboard")
-        self.paste_mode_var = ctk.StringVar(value=PASTE_MODE_LABELS.get(paste_value, "Clipboard"))
         _, self.paste_help_label = self._create_labeled_dropdown(
             output,
             "Paste Method",
-            values=list(PASTE_MODE_LABELS.values()),
+            values=PASTE_MODE.labels,
             variable=self.paste_mode_var,
             help_text="How text is inserted",
             width=120,
@@ -1754,7 +2795,6 @@ class SettingsWindow:
         preview = self._create_section_header(section, "Preview Window", "Floating overlay showing transcription progress", show_divider=True)
 
         # Show preview toggle
-        self.preview_enabled_var = ctk.BooleanVar(value=self.config.get("preview_enabled", True))
         self._create_toggle_setting(
             preview,
             "Show preview window",
@@ -1763,29 +2803,24 @@ class SettingsWindow:
         )
 
         # Preview position (use display labels)
-        pos_value = self.config.get("preview_position", "bottom_right")
-        self.preview_position_var = ctk.StringVar(value=PREVIEW_POSITION_LABELS.get(pos_value, "Bottom Right"))
         self._create_labeled_dropdown(
             preview,
             "Position",
-            values=list(PREVIEW_POSITION_LABELS.values()),
+            values=PREVIEW_POSITION.labels,
             variable=self.preview_position_var,
             width=140,
         )
 
         # Preview theme (use display labels)
-        theme_value = self.config.get("preview_theme", "dark")
-        self.preview_theme_var = ctk.StringVar(value=PREVIEW_THEME_LABELS.get(theme_value, "Dark"))
         self._create_labeled_dropdown(
             preview,
             "Theme",
-            values=list(PREVIEW_THEME_LABELS.values()),
+            values=PREVIEW_THEME.labels,
             variable=self.preview_theme_var,
             width=100,
         )
 
         # Auto-hide delay
-        self.preview_delay_var = ctk.StringVar(value=str(self.config.get("preview_auto_hide_delay", 2.0)))
         self._create_labeled_entry(
             preview,
             "Auto-hide Delay",
@@ -1794,13 +2829,9 @@ class SettingsWindow:
             width=80,
         )
 
-        # Preview font size
-        self.preview_font_size_var = ctk.IntVar(value=self.config.get("preview_font_size", 11))
-
         # Startup section
         startup = self._create_section_header(section, "Startup", show_divider=True)
 
-        self.startup_var = ctk.BooleanVar(value=self.config.get("start_with_windows", False))
         self._create_toggle_setting(
             startup,
             "Start with Windows",
@@ -1827,7 +2858,7 @@ class SettingsWindow:
         mic_lbl = ctk.CTkLabel(
             mic_container,
             text="Microphone",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             anchor="w",
         )
@@ -1836,51 +2867,25 @@ class SettingsWindow:
         mic_row = ctk.CTkFrame(mic_container, fg_color="transparent")
         mic_row.pack(fill="x", pady=(SPACE_SM, 0))
 
-        self.devices_list = settings_logic.get_input_devices()
         display_names = [name for name, _ in self.devices_list]
-        current_device = settings_logic.get_device_display_name(
-            self.config.get("input_device"),
-            self.devices_list,
-        )
-
-        self.device_var = ctk.StringVar(value=current_device)
-        self.device_combo = ctk.CTkComboBox(
+        # Searchable: machines can list dozens of input devices
+        self.device_combo = SearchableDropdown(
             mic_row,
             values=display_names,
             variable=self.device_var,
             command=lambda choice: self._autosave(),
             width=280,
-            height=36,
-            corner_radius=12,
-            border_width=1,
-            fg_color=SLATE_800,
-            border_color=SLATE_600,
-            button_color=SLATE_700,
-            button_hover_color=SLATE_600,
-            dropdown_fg_color=SLATE_700,
-            dropdown_hover_color=SLATE_600,
-            dropdown_text_color=SLATE_200,
-            text_color=SLATE_200,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
-            state="readonly",
         )
         self.device_combo.pack(side="left")
 
-        # Add toggle behavior, hand cursor, and make entire combobox clickable
-        make_combobox_clickable(self.device_combo)
-
         refresh_btn = self._create_button(mic_row, "Refresh", self.refresh_devices, width=80)
         refresh_btn.pack(side="left", padx=(SPACE_SM, 0))
 
         # Sample rate
-        sample_rate = self.config.get("sample_rate", 16000)
-        self.rate_var = ctk.StringVar(
-            value=SAMPLE_RATE_OPTIONS.get(sample_rate, SAMPLE_RATE_OPTIONS[16000])
-        )
         self._create_labeled_dropdown(
             device,
             "Sample Rate",
-            values=list(SAMPLE_RATE_OPTIONS.values()),
+            values=SAMPLE_RATE.labels,
             variable=self.rate_var,
             width=280,
         )
@@ -1888,7 +2893,6 @@ class SettingsWindow:
         # Noise Gate section
         gate = self._create_section_header(section, "Noise Gate", "Filter out background noise below a threshold", show_divider=True)
 
-        self.noise_gate_var = ctk.BooleanVar(value=self.config.get("noise_gate_enabled", False))
         self._create_toggle_setting(
             gate,
             "Enable noise gate",
@@ -1903,19 +2907,15 @@ class SettingsWindow:
         threshold_lbl = ctk.CTkLabel(
             threshold_container,
             text="Threshold Level",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             anchor="w",
         )
         threshold_lbl.pack(fill="x")
 
-        self.noise_threshold_var = ctk.IntVar(value=self.config.get("noise_gate_threshold_db", -40))
-
         meter_row = ctk.CTkFrame(threshold_container, fg_color="transparent")
         meter_row.pack(fill="x", pady=(SPACE_SM, 0))
 
-        self.meter_width = 300
-        self.meter_height = 20
         self.noise_level_canvas = tk.Canvas(
             meter_row,
             width=self.meter_width,
@@ -1927,33 +2927,40 @@ class SettingsWindow:
         )
         self.noise_level_canvas.pack(side="left")
 
-        # Gradient fill (green → orange → red)
-        if not self.meter_gradient_photo:
-            self.meter_gradient_photo = self._create_meter_gradient(self.meter_width, self.meter_height)
-
-        self.meter_gradient_item = self.noise_level_canvas.create_image(
-            0, 0, anchor="nw", image=self.meter_gradient_photo
-        )
-
-        # Level mask - covers the gradient (fully covered when idle, reveals left portion during test)
-        self.noise_level_bar = self.noise_level_canvas.create_rectangle(
-            0, 0, self.meter_width, self.meter_height,
-            fill=SLATE_800, width=0, state="normal"
+        # Level image: gradient lit up to the current level (all dark when idle)
+        self.meter_level_item = self.noise_level_canvas.create_image(
+            0, 0, anchor="nw", image=self._meter_frame(0)
         )
+        self._last_meter_x = 0
 
-        # Threshold marker
+        # Threshold marker: a 3px frame placed over the canvas, so moving it is
+        # one geometry call rather than a canvas item redraw
         thresh_x = self._db_to_x(self.noise_threshold_var.get())
-        self.threshold_marker = self.noise_level_canvas.create_line(
-            thresh_x, 0, thresh_x, self.meter_height, fill=PRIMARY_LIGHT, width=3
+        self.threshold_marker = tk.Frame(
+            self.noise_level_canvas, width=3, height=self.meter_height,
+            bg=PRIMARY_LIGHT, cursor="hand2",
         )
-
-        self.noise_level_canvas.bind("<Button-1>", self._on_threshold_click)
-        self.noise_level_canvas.bind("<B1-Motion>", self._on_threshold_drag)
+        self.threshold_marker.place(x=thresh_x - 1, y=0)
+
+        def from_marker(handler):
+            # Marker events arrive in marker coordinates; re-base them on the canvas
+            def on_marker_event(event):
+                event.x = event.x_root - self.noise_level_canvas.winfo_rootx()
+                handler(event)
+            return on_marker_event
+
+        for sequence, handler in (
+            ("<Button-1>", self._on_threshold_click),
+            ("<B1-Motion>", self._on_threshold_click),
+            ("<ButtonRelease-1>", self._on_threshold_release),
+        ):
+            self.noise_level_canvas.bind(sequence, handler)
+            self.threshold_marker.bind(sequence, from_marker(handler))
 
         self.threshold_label = ctk.CTkLabel(
             meter_row,
             text=f"{self.noise_threshold_var.get()} dB",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_300,
             width=60,
         )
@@ -1962,7 +2969,7 @@ class SettingsWindow:
         threshold_help = ctk.CTkLabel(
             threshold_container,
             text="Click or drag to adjust threshold",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=_font(11),
             text_color=SLATE_500,
             anchor="w",
         )
@@ -1975,7 +2982,6 @@ class SettingsWindow:
         # Audio Feedback section
         feedback = self._create_section_header(section, "Audio Feedback", "Sound notifications for recording events", show_divider=True)
 
-        self.feedback_var = ctk.BooleanVar(value=self.config.get("audio_feedback", True))
         self._create_toggle_setting(
             feedback,
             "Enable sounds",
@@ -1984,17 +2990,8 @@ class SettingsWindow:
         )
 
         # Sound checkboxes
-        self.sound_processing_var = ctk.BooleanVar(value=self.config.get("sound_processing", True))
-        self._create_checkbox_setting(feedback, "Processing sound", self.sound_processing_var)
-
-        self.sound_success_var = ctk.BooleanVar(value=self.config.get("sound_success", True))
-        self._create_checkbox_setting(feedback, "Success sound", self.sound_success_var)
-
-        self.sound_error_var = ctk.BooleanVar(value=self.config.get("sound_error", True))
-        self._create_checkbox_setting(feedback, "Error sound", self.sound_error_var)
-
-        self.sound_command_var = ctk.BooleanVar(value=self.config.get("sound_command", True))
-        self._create_checkbox_setting(feedback, "Command sound", self.sound_command_var)
+        for attr, _, label in SOUND_CHECKBOXES:
+            self._create_checkbox_setting(feedback, label, getattr(self, attr))
 
         # Volume slider
         volume_container = ctk.CTkFrame(feedback, fg_color="transparent")
@@ -2003,7 +3000,7 @@ class SettingsWindow:
         volume_lbl = ctk.CTkLabel(
             volume_container,
             text="Volume",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             anchor="w",
         )
@@ -2012,8 +3009,6 @@ class SettingsWindow:
         slider_row = ctk.CTkFrame(volume_container, fg_color="transparent")
         slider_row.pack(fill="x", pady=(SPACE_SM, 0))
 
-        self.volume_var = ctk.IntVar(value=self.config.get("audio_feedback_volume", 100))
-
         slider = ctk.CTkSlider(
             slider_row,
             from_=0,
@@ -2031,48 +3026,45 @@ class SettingsWindow:
         self.volume_label = ctk.CTkLabel(
             slider_row,
             text=f"{self.volume_var.get()}%",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_300,
             width=50,
         )
         self.volume_label.pack(side="left", padx=(SPACE_MD, 0))
 
-        def update_volume_label(*args):
-            self.volume_label.configure(text=f"{self.volume_var.get()}%")
-            # Schedule debounced autosave
-            self._slider_debounce.schedule()
-        self.volume_var.trace_add("write", update_volume_label)
-
     def _db_to_x(self, db):
-        """Convert dB value to x position on meter."""
+        """Convert dB value to x position on meter (clamped to the meter)."""
         # Range: -80 to 0 dB
-        normalized = (db + 80) / 80
-        return int(normalized * self.meter_width)
+        x = int((db + 80) * self.meter_width // 80)
+        return 0 if x < 0 else min(x, self.meter_width)
 
     def _x_to_db(self, x):
-        """Convert x position to dB value."""
-        normalized = x / self.meter_width
-        return int(normalized * 80 - 80)
+        """Convert x position to dB value (truncated toward zero)."""
+        return -((80 * (self.meter_width - x)) // self.meter_width)
 
     def _on_threshold_click(self, event):
-        """Handle click on threshold meter."""
+        """Handle click or drag on threshold meter, ignoring drag moves under 2px."""
+        if self._drag_last_x is not None and abs(event.x - self._drag_last_x) < 2:
+            return
+        self._drag_last_x = event.x
         db = self._x_to_db(event.x)
         db = max(-80, min(0, db))
         self.noise_threshold_var.set(db)
-        self.noise_level_canvas.coords(
-            self.threshold_marker,
-            event.x, 0, event.x, self.meter_height
-        )
+        self.threshold_marker.place_configure(x=event.x - 1)
         self.threshold_label.configure(text=f"{db} dB")
         # Schedule debounced autosave (for drag operations)
-        self._slider_debounce.schedule()
+        self._autosave()
 
-    def _on_threshold_drag(self, event):
-        """Handle drag on threshold meter."""
-        self._on_threshold_click(event)
+    def _on_threshold_release(self, event):
+        """Finish a threshold drag at the exact release position."""
+        last_x, self._drag_last_x = self._drag_last_x, None
+        if last_x is not None and event.x != last_x:
+            self._on_threshold_click(event)
+        self._drag_last_x = None
 
     def refresh_devices(self):
         """Refresh the device list."""
+        settings_logic.invalidate_input_devices()  # Explicit refresh re-enumerates
         self.devices_list = settings_logic.get_input_devices()
         display_names = [name for name, _ in self.devices_list]
         self.device_combo.configure(values=display_names)
@@ -2088,11 +3080,8 @@ class SettingsWindow:
 
     def start_noise_test(self):
         """Start microphone test with real audio monitoring."""
-        try:
-            import sounddevice as sd
-            import numpy as np
-        except ImportError:
-            messagebox.showerror("Error", "sounddevice or numpy not installed")
+        if np is None:
+            messagebox.showerror("Error", "numpy not installed")
             return
 
         self.noise_test_running = True
@@ -2108,23 +3097,29 @@ class SettingsWindow:
             """Process audio data and update meter."""
             if not self.noise_test_running:
                 return
-            # Calculate RMS level
-            rms = np.sqrt(np.mean(indata**2))
-            # Convert to dB (with floor at -80)
-            if rms > 0:
-                db = 20 * np.log10(rms)
-                db = max(-80, min(0, db))
+            # Mean square via one dot product (no temporary arrays)
+            flat = indata.reshape(-1)
+            ss = float(np.dot(flat, flat))
+            # Convert to dB (with floor at -80); 20*log10(rms) == 10*log10(ms)
+            if ss > 0:
+                db = min(0.0, max(-80.0, 10.0 * math.log10(ss / flat.shape[0])))
             else:
-                db = -80
-            # Schedule UI update on main thread
-            self.window.after(0, lambda: self._update_noise_meter(db))
+                db = -80.0
+            # Keep only the latest level; at most one redraw per frame is queued
+            self._meter_last_db = db
+            if not self._meter_pending:
+                self._meter_pending = True
+                self.window.after(METER_FRAME_MS, self._drain_meter)
 
         try:
+            # Test at the configured rate; blocksize=0 lets PortAudio use the
+            # host's preferred buffer size (meter redraws are capped separately)
             self.audio_stream = sd.InputStream(
                 device=device_index,
                 channels=1,
-                samplerate=16000,
-                blocksize=1024,
+                samplerate=SAMPLE_RATE.rev.get(self.rate_var.get(), 16000),
+                blocksize=0,
+                latency="low",
                 callback=audio_callback,
             )
             self.audio_stream.start()
@@ -2133,32 +3128,47 @@ class SettingsWindow:
             self.noise_test_btn.configure(text="Test Microphone", fg_color=SLATE_800, hover_color=SLATE_700)
             messagebox.showerror("Error", f"Could not open audio device: {e}")
 
+    def _drain_meter(self):
+        """Redraw the meter with the latest level from the audio callback."""
+        self._meter_pending = False
+        self._update_noise_meter(self._meter_last_db)
+
     def _update_noise_meter(self, db):
         """Update the noise meter display with current level."""
         if not self.noise_test_running:
             return
         x = self._db_to_x(db)
-        # Update mask to cover inactive portion (from current level to right edge)
-        self.noise_level_canvas.coords(self.noise_level_bar, x, 0, self.meter_width, self.meter_height)
-        self.noise_level_canvas.itemconfigure(self.noise_level_bar, state="normal")
+        if x < self.meter_width:
+            x -= x % METER_FRAME_STEP
+        if x == self._last_meter_x:
+            return  # Same level image as the last redraw
+        self._last_meter_x = x
+        self.noise_level_canvas.itemconfigure(self.meter_level_item, image=self._meter_frame(x))
 
     def stop_noise_test(self):
         """Stop microphone test."""
         self.noise_test_running = False
         self.noise_test_btn.configure(text="Test Microphone", fg_color=SLATE_800, hover_color=SLATE_700)
 
-        # Stop audio stream
-        if hasattr(self, 'audio_stream') and self.audio_stream:
-            try:
-                self.audio_stream.stop()
-                self.audio_stream.close()
-            except Exception:
-                pass
+        # Stop audio stream off the UI thread (PortAudio's stop can block while
+        # its callback thread drains)
+        if self.audio_stream is not None:
+            stream = self.audio_stream
             self.audio_stream = None
 
-        # Reset mask to cover entire gradient (hide the meter)
-        if hasattr(self, 'noise_level_bar'):
-            self.noise_level_canvas.coords(self.noise_level_bar, 0, 0, self.meter_width, self.meter_height)
+            def close_stream():
+                try:
+                    stream.stop()
+                    stream.close()
+                except Exception:
+                    pass
+
+            threading.Thread(target=close_stream, daemon=True).start()
+
+        # Back to the dark idle meter
+        if self.meter_level_item is not None:
+            self.noise_level_canvas.itemconfigure(self.meter_level_item, image=self._meter_frame(0))
+            self._last_meter_x = 0
 
     # =========================================================================
     # RECOGNITION SECTION
@@ -2172,15 +3182,8 @@ class SettingsWindow:
         # Whisper Model section (first section - no separator)
         model = self._create_section_header(section, "Whisper Model", "Recommended for most users")
 
-        # Model var stores internal name (tiny, base, etc.)
-        # Dropdown displays friendly names (Quick, Standard, etc.)
-        initial_model = self.config.get("model_size", "tiny")
-        self.model_var = ctk.StringVar(value=initial_model)
-
         # Create display names list in same order as MODEL_OPTIONS
         display_names = [config.MODEL_DISPLAY_NAMES.get(m, m) for m in config.MODEL_OPTIONS]
-        initial_display = config.MODEL_DISPLAY_NAMES.get(initial_model, initial_model)
-        self._model_display_var = ctk.StringVar(value=initial_display)
 
         def on_model_display_changed(display_name):
             # Convert display name back to internal name
@@ -2202,7 +3205,7 @@ class SettingsWindow:
         learn_more_link = ctk.CTkLabel(
             model,
             text="Learn more about models",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=_font(11),
             text_color=PRIMARY,
             cursor="hand2",
             anchor="w",
@@ -2223,7 +3226,7 @@ class SettingsWindow:
         self.model_status_text = ctk.CTkLabel(
             model_status_row,
             text="Checking...",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_300,
         )
         self.model_status_text.pack(side="left")
@@ -2234,7 +3237,7 @@ class SettingsWindow:
             self.download_model_frame,
             text="Download Model",
             command=self._download_selected_model,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
             corner_radius=6,
@@ -2245,7 +3248,7 @@ class SettingsWindow:
         self.download_model_size_label = ctk.CTkLabel(
             self.download_model_frame,
             text="",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=_font(11),
             text_color=SLATE_500,
         )
         self.download_model_size_label.pack(side="left", padx=(SPACE_SM, 0))
@@ -2256,7 +3259,6 @@ class SettingsWindow:
         # Refresh model status on load
         self.window.after(100, self.refresh_model_status)
 
-        self.silence_var = ctk.StringVar(value=str(self.config.get("silence_duration_sec", 2.0)))
         self._create_labeled_entry(
             model,
             "Silence Duration",
@@ -2281,7 +3283,7 @@ class SettingsWindow:
         self.gpu_status_text = ctk.CTkLabel(
             status_row,
             text="Checking...",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_300,
         )
         self.gpu_status_text.pack(side="left")
@@ -2296,7 +3298,7 @@ class SettingsWindow:
             self.install_gpu_frame,
             text="Install GPU Support",
             command=self.install_gpu_support,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
             corner_radius=6,
@@ -2307,7 +3309,7 @@ class SettingsWindow:
         install_help = ctk.CTkLabel(
             self.install_gpu_frame,
             text="?",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11, weight="bold"),
+            font=_font(11, "bold"),
             text_color=SLATE_500,
             cursor="question_arrow",
         )
@@ -2316,13 +3318,10 @@ class SettingsWindow:
         self.install_gpu_frame.pack(fill="x", pady=(SPACE_SM, 0))
 
         # Processing mode
-        processing_mode = self.config.get("processing_mode", "auto")
-        mode_label = config.PROCESSING_MODE_LABELS.get(processing_mode, "Auto")
-        self.processing_mode_var = ctk.StringVar(value=mode_label)
         self._create_labeled_dropdown(
             gpu,
             "Processing Mode",
-            values=list(config.PROCESSING_MODE_LABELS.values()),
+            values=PROCESSING_MODE.labels,
             variable=self.processing_mode_var,
             help_text="Auto uses GPU if available, otherwise CPU",
             width=160,
@@ -2334,7 +3333,6 @@ class SettingsWindow:
         # Translation section
         trans = self._create_section_header(section, "Translation", "Translate spoken audio to English", show_divider=True)
 
-        self.translation_enabled_var = ctk.BooleanVar(value=self.config.get("translation_enabled", False))
         self._create_toggle_setting(
             trans,
             "Enable translation",
@@ -2342,18 +3340,14 @@ class SettingsWindow:
             variable=self.translation_enabled_var,
         )
 
-        self.trans_lang_var = ctk.StringVar(
-            value=settings_logic.language_code_to_label(
-                self.config.get("translation_source_language", "auto")
-            )
-        )
         self._create_labeled_dropdown(
             trans,
             "Source Language",
-            values=settings_logic.get_language_labels(),
+            values=LANGUAGE.labels,
             variable=self.trans_lang_var,
             help_text="Language being spoken",
             width=160,
+            searchable=True,
         )
 
     # =========================================================================
@@ -2365,12 +3359,30 @@ class SettingsWindow:
         self.refresh_model_status()
 
     def refresh_model_status(self):
-        """Refresh model status display."""
+        """Refresh model status display (the file check runs off the UI thread)."""
+        if "recognition" not in self.sections:
+            return
         model_name = self.model_var.get()
+        window = self.window
+
+        def check():
+            from dependency_check import check_model_available
+            is_available, _ = check_model_available(model_name)
+            window.after(0, self._apply_model_status, model_name, is_available)
+
+        threading.Thread(target=check, daemon=True).start()
 
-        # Check if model is available
-        from dependency_check import check_model_available
-        is_available, _ = check_model_available(model_name)
+    def _apply_model_status(self, model_name, is_available):
+        """Show a model availability result from refresh_model_status."""
+        # Section rebuilt/closed or a newer model selected since the check began
+        if "recognition" not in self.sections or model_name != self.model_var.get():
+            return
+
+        # Everything shown below follows from these two values
+        state = (model_name, is_available)
+        if state == self._last_model_status:
+            return
+        self._last_model_status = state
 
         if is_available:
             # Green status - model installed
@@ -2434,16 +3446,13 @@ class SettingsWindow:
         dialog.configure(fg_color=SLATE_800)
 
         # Center on parent
-        dialog.update_idletasks()
-        x = self.window.winfo_x() + (self.window.winfo_width() - 350) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - 150) // 2
-        dialog.geometry(f"+{x}+{y}")
+        _center_dialog(dialog, self.window, 350, 150)
 
         # Set icon
         try:
-            icon_path = resource_path("icon.ico")
-            if os.path.exists(icon_path):
-                dialog.after(200, lambda: dialog.iconbitmap(icon_path))
+            icon_path = _existing_resource("icon.ico")
+            if icon_path:
+                dialog.after(200, dialog.iconbitmap, icon_path)
         except Exception:
             pass
 
@@ -2453,7 +3462,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             frame,
             text=message,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_200,
             wraplength=310,
             justify="center",
@@ -2463,7 +3472,7 @@ class SettingsWindow:
             frame,
             text="OK",
             command=dialog.destroy,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
             width=80,
@@ -2491,16 +3500,13 @@ class SettingsWindow:
         dialog.configure(fg_color=SLATE_800)
 
         # Center on parent
-        dialog.update_idletasks()
-        x = self.window.winfo_x() + (self.window.winfo_width() - 380) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - 180) // 2
-        dialog.geometry(f"+{x}+{y}")
+        _center_dialog(dialog, self.window, 380, 180)
 
         # Set icon
         try:
-            icon_path = resource_path("icon.ico")
-            if os.path.exists(icon_path):
-                dialog.after(200, lambda: dialog.iconbitmap(icon_path))
+            icon_path = _existing_resource("icon.ico")
+            if icon_path:
+                dialog.after(200, dialog.iconbitmap, icon_path)
         except Exception:
             pass
 
@@ -2510,14 +3516,14 @@ class SettingsWindow:
         ctk.CTkLabel(
             frame,
             text=f"Download {model_name} Model?",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=15, weight="bold"),
+            font=_font(15, "bold"),
             text_color=SLATE_100,
         ).pack(pady=(SPACE_SM, SPACE_SM))
 
         ctk.CTkLabel(
             frame,
             text=f"Download size: {size_text}\nThis may take a few minutes.",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=_font(12),
             text_color=SLATE_400,
             justify="center",
         ).pack(pady=(0, SPACE_LG))
@@ -2533,7 +3539,7 @@ class SettingsWindow:
             btn_frame,
             text="Download",
             command=on_yes,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
             width=100,
@@ -2544,7 +3550,7 @@ class SettingsWindow:
             btn_frame,
             text="Cancel",
             command=dialog.destroy,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             fg_color=SLATE_700,
             hover_color=SLATE_600,
             width=100,
@@ -2559,8 +3565,24 @@ class SettingsWindow:
     # =========================================================================
 
     def refresh_gpu_status(self):
-        """Refresh GPU status display."""
-        is_available, status_msg, detail = settings_logic.get_cuda_status()
+        """Refresh GPU status display (CUDA detection runs off the UI thread)."""
+        if "recognition" not in self.sections:
+            return
+        window = self.window
+
+        def check():
+            window.after(0, self._apply_gpu_status, *settings_logic.get_cuda_status())
+
+        threading.Thread(target=check, daemon=True).start()
+
+    def _apply_gpu_status(self, is_available, status_msg, detail):
+        """Show a CUDA detection result from refresh_gpu_status."""
+        if "recognition" not in self.sections:
+            return
+        state = (is_available, status_msg, detail)
+        if state == self._last_gpu_status:
+            return
+        self._last_gpu_status = state
         cuda_libs_installed = status_msg != "GPU libraries not installed"
 
         if is_available:
@@ -2593,18 +3615,15 @@ class SettingsWindow:
         dialog.grab_set()
 
         # Center on parent
-        dialog.update_idletasks()
-        x = self.window.winfo_x() + (self.window.winfo_width() - 420) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - 200) // 2
-        dialog.geometry(f"+{x}+{y}")
+        _center_dialog(dialog, self.window, 420, 200)
 
         dialog.configure(fg_color=SLATE_800)
 
         # Set window icon
         try:
-            icon_path = resource_path("icon.ico")
-            if os.path.exists(icon_path):
-                dialog.after(200, lambda: dialog.iconbitmap(icon_path))
+            icon_path = _existing_resource("icon.ico")
+            if icon_path:
+                dialog.after(200, dialog.iconbitmap, icon_path)
         except Exception:
             pass
 
@@ -2615,7 +3634,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             frame,
             text="Install NVIDIA CUDA Libraries?",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=SLATE_100,
         ).pack(pady=(SPACE_MD, SPACE_MD), anchor="center")
 
@@ -2623,7 +3642,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             frame,
             text="Download size: ~2-3 GB\nRequires: NVIDIA GPU with CUDA support",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=_font(12),
             text_color=SLATE_400,
             justify="center",
         ).pack(pady=(0, SPACE_LG))
@@ -2643,7 +3662,7 @@ class SettingsWindow:
             btn_frame,
             text="Install",
             command=on_yes,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             fg_color=PRIMARY,
             hover_color=PRIMARY_DARK,
             width=100,
@@ -2654,7 +3673,7 @@ class SettingsWindow:
             btn_frame,
             text="Cancel",
             command=on_no,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             fg_color=SLATE_700,
             hover_color=SLATE_600,
             width=100,
@@ -2681,10 +3700,7 @@ class SettingsWindow:
         dialog.grab_set()
 
         # Center on parent window
-        dialog.update_idletasks()
-        x = self.window.winfo_x() + (self.window.winfo_width() - 420) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - 200) // 2
-        dialog.geometry(f"+{x}+{y}")
+        _center_dialog(dialog, self.window, 420, 200)
 
         # Prevent closing during install
         dialog.protocol("WM_DELETE_WINDOW", lambda: None)
@@ -2694,9 +3710,9 @@ class SettingsWindow:
 
         # Set window icon
         try:
-            icon_path = resource_path("icon.ico")
-            if os.path.exists(icon_path):
-                dialog.after(200, lambda: dialog.iconbitmap(icon_path))
+            icon_path = _existing_resource("icon.ico")
+            if icon_path:
+                dialog.after(200, dialog.iconbitmap, icon_path)
         except Exception:
             pass
 
@@ -2706,11 +3722,9 @@ class SettingsWindow:
         # Logo
         try:
             logo_path = resource_path(os.path.join("assets", "logo", "murmurtone-icon-transparent.png"))
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
-                logo_ctk = ctk.CTkImage(light_image=logo_img, dark_image=logo_img, size=(48, 48))
-                logo_label = ctk.CTkLabel(frame, image=logo_ctk, text="")
-                logo_label.pack(pady=(0, SPACE_SM))
+            logo_ctk = _cached_ctk_image(logo_path, (48, 48))
+            logo_label = ctk.CTkLabel(frame, image=logo_ctk, text="")
+            logo_label.pack(pady=(0, SPACE_SM))
         except Exception:
             pass  # Skip logo if it fails to load
 
@@ -2718,21 +3732,21 @@ class SettingsWindow:
         title_label = ctk.CTkLabel(
             frame,
             text="Installing NVIDIA CUDA Libraries",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=SLATE_100,
         )
         title_label.pack(pady=(0, SPACE_MD))
 
-        # Progress bar
-        progress = ctk.CTkProgressBar(frame, width=360, mode="indeterminate")
+        # Progress bar, advanced from the download sizes pip reports
+        progress = ctk.CTkProgressBar(frame, width=360, mode="determinate")
+        progress.set(0)
         progress.pack(pady=SPACE_SM)
-        progress.start()
 
         # Status label
         status_label = ctk.CTkLabel(
             frame,
             text="Downloading... this may take several minutes",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=_font(12),
             text_color=SLATE_400,
         )
         status_label.pack(pady=SPACE_SM)
@@ -2741,7 +3755,7 @@ class SettingsWindow:
         size_hint = ctk.CTkLabel(
             frame,
             text="(Download size: ~2-3 GB)",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+            font=_font(11),
             text_color=SLATE_500,
         )
         size_hint.pack()
@@ -2759,31 +3773,65 @@ class SettingsWindow:
                     "nvidia-cublas-cu12>=12.1.0",
                     "nvidia-cudnn-cu12>=9.1.0",
                 ]
-                result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install"] + gpu_packages,
-                    capture_output=True,
+                # Stream unbuffered output line by line so pip never blocks on a
+                # full pipe; only the tail is kept for the error dialog
+                proc = subprocess.Popen(
+                    [sys.executable, "-u", "-m", "pip", "install"] + gpu_packages,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
                     text=True,
+                    bufsize=1,
                     cwd=app_dir,
                 )
-                success = result.returncode == 0
-                output = result.stdout + result.stderr
+                tail = deque(maxlen=500)
+                downloaded = 0  # Bytes of downloads pip has announced so far
+                with proc.stdout:
+                    for line in proc.stdout:
+                        tail.append(line.rstrip("\n"))
+                        status = settings_logic.pip_status_line(line)
+                        if not status:
+                            continue
+                        self.window.after(0, self._set_install_status, status)
+
+                        # pip announces each file's size as its download starts,
+                        # so earlier files are done when the next one begins
+                        size = settings_logic.pip_download_bytes(line)
+                        if size:
+                            fraction = downloaded / settings_logic.GPU_INSTALL_BYTES_ESTIMATE
+                            downloaded += size
+                        elif status.startswith("Installing"):
+                            fraction = 1.0
+                        else:
+                            continue
+                        self.window.after(0, self._set_install_progress, min(fraction, 1.0))
+                success = proc.wait() == 0
+                output = "\n".join(tail)
 
                 # Schedule UI update on main thread
-                self.window.after(0, lambda: self._install_complete(success, output))
+                self.window.after(0, self._install_complete, success, output)
             except Exception as e:
-                self.window.after(0, lambda: self._install_complete(False, str(e)))
+                self.window.after(0, self._install_complete, False, str(e))
 
         # Run in background thread
         thread = threading.Thread(target=run_install, daemon=True)
         thread.start()
 
+    def _set_install_status(self, text):
+        """Show the current pip phase in the install dialog."""
+        if self._install_status is not None:
+            self._install_status.configure(text=text)
+
+    def _set_install_progress(self, fraction):
+        """Move the install dialog's progress bar to fraction (0.0-1.0)."""
+        if self._install_progress is not None:
+            self._install_progress.set(fraction)
+
     def _install_complete(self, success, output):
         """Handle completion of GPU installation."""
-        # Stop progress and close dialog
-        if hasattr(self, "_install_progress"):
-            self._install_progress.stop()
-        if hasattr(self, "_install_dialog") and self._install_dialog:
+        # Close dialog
+        if self._install_dialog is not None:
             self._install_dialog.destroy()
+        self._install_dialog = self._install_progress = self._install_status = None
 
         if success:
             messagebox.showinfo(
@@ -2818,7 +3866,6 @@ class SettingsWindow:
         # Voice Commands section (first section - no separator)
         commands = self._create_section_header(section, "Voice Commands", 'Spoken commands like "new line" or "period"')
 
-        self.voice_commands_var = ctk.BooleanVar(value=self.config.get("voice_commands_enabled", True))
         self._create_toggle_setting(
             commands,
             "Enable voice commands",
@@ -2826,7 +3873,6 @@ class SettingsWindow:
             variable=self.voice_commands_var,
         )
 
-        self.scratch_that_var = ctk.BooleanVar(value=self.config.get("scratch_that_enabled", True))
         self._create_toggle_setting(
             commands,
             '"Scratch that" command',
@@ -2837,7 +3883,6 @@ class SettingsWindow:
         # Filler Word Removal section
         filler = self._create_section_header(section, "Filler Word Removal", "Clean up hesitation sounds from transcriptions", show_divider=True)
 
-        self.filler_var = ctk.BooleanVar(value=self.config.get("filler_removal_enabled", False))
         self._create_toggle_setting(
             filler,
             "Remove filler words",
@@ -2845,7 +3890,6 @@ class SettingsWindow:
             variable=self.filler_var,
         )
 
-        self.filler_aggressive_var = ctk.BooleanVar(value=self.config.get("filler_removal_aggressive", False))
         self._create_toggle_setting(
             filler,
             "Aggressive mode",
@@ -2907,7 +3951,6 @@ class SettingsWindow:
         # AI Text Cleanup section (first section - no separator)
         ai = self._create_section_header(section, "AI Text Cleanup", "Use local LLM to polish transcriptions")
 
-        self.ai_cleanup_var = ctk.BooleanVar(value=self.config.get("ai_cleanup_enabled", False))
         self._create_toggle_setting(
             ai,
             "Enable AI cleanup",
@@ -2924,7 +3967,7 @@ class SettingsWindow:
         self.ollama_status_text = ctk.CTkLabel(
             status_row,
             text="Not checked",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_300,
         )
         self.ollama_status_text.pack(side="left")
@@ -2934,7 +3977,6 @@ class SettingsWindow:
         check_btn.pack(side="left", padx=(SPACE_LG, 0))
 
         # Cleanup mode
-        self.ai_mode_var = ctk.StringVar(value=self.config.get("ai_cleanup_mode", "grammar"))
         self._create_labeled_dropdown(
             ai,
             "Cleanup Mode",
@@ -2945,7 +3987,6 @@ class SettingsWindow:
         )
 
         # Formality level
-        self.ai_formality_var = ctk.StringVar(value=self.config.get("ai_formality_level", "professional"))
         self._create_labeled_dropdown(
             ai,
             "Formality Level",
@@ -2955,7 +3996,6 @@ class SettingsWindow:
         )
 
         # Ollama model
-        self.ai_model_var = ctk.StringVar(value=self.config.get("ollama_model", "llama3.2"))
         self._create_labeled_entry(
             ai,
             "Ollama Model",
@@ -2987,26 +4027,48 @@ class SettingsWindow:
         )
         reset_btn.pack(anchor="w", pady=(0, SPACE_SM))
 
+    @functools.cached_property
+    def _http(self):
+        """HTTP session for local service checks, created on first use to keep requests off startup."""
+        import requests
+        return requests.Session()
+
     def _check_ollama(self):
-        """Check Ollama connection."""
-        try:
-            import requests
-            url = self.config.get("ollama_url", "http://localhost:11434")
-            # Validate URL before making request (prevents SSRF)
-            if not validate_ollama_url(url):
-                self.ollama_status_dot.configure(fg_color=ERROR)
-                self.ollama_status_text.configure(text="Invalid URL")
-                return
-            response = requests.get(f"{url}/api/tags", timeout=2)
-            if response.status_code == 200:
-                self.ollama_status_dot.configure(fg_color=SUCCESS)
-                self.ollama_status_text.configure(text="Ollama connected")
-            else:
-                self.ollama_status_dot.configure(fg_color=ERROR)
-                self.ollama_status_text.configure(text="Connection failed")
-        except Exception:
-            self.ollama_status_dot.configure(fg_color=ERROR)
-            self.ollama_status_text.configure(text="Not running")
+        """Check Ollama connection on a background thread."""
+        from ai_cleanup import validate_ollama_url
+        url = self.config.get("ollama_url", "http://localhost:11434")
+        # Validate URL before making request (prevents SSRF)
+        if not validate_ollama_url(url):
+            self._apply_ollama_status(ERROR, "Invalid URL")
+            return
+
+        if self._ollama_check_pending:
+            return  # Previous check still waiting on Ollama
+        self._ollama_check_pending = True
+        self.ollama_status_text.configure(text="Checking...")
+        window = self.window
+
+        def check():
+            try:
+                response = self._http.get(f"{url}/api/tags", timeout=2)
+                if response.status_code == 200:
+                    result = (SUCCESS, "Ollama connected")
+                else:
+                    result = (ERROR, "Connection failed")
+            except Exception:
+                result = (ERROR, "Not running")
+            window.after(0, self._apply_ollama_status, *result)
+
+        threading.Thread(target=check, daemon=True).start()
+
+    def _apply_ollama_status(self, color, text):
+        """Show an Ollama check result (runs on the Tk thread)."""
+        self._ollama_check_pending = False
+        # Advanced section torn down while the check was running
+        if "advanced" not in self.sections:
+            return
+        self.ollama_status_dot.configure(fg_color=color)
+        self.ollama_status_text.configure(text=text)
 
     def _view_history(self):
         """View transcription history."""
@@ -3042,7 +4104,7 @@ class SettingsWindow:
         logo_icon = ctk.CTkLabel(
             logo,
             text="🎤",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=28),
+            font=_font(28),
         )
         logo_icon.place(relx=0.5, rely=0.5, anchor="center")
 
@@ -3053,7 +4115,7 @@ class SettingsWindow:
         name = ctk.CTkLabel(
             details,
             text="MurmurTone",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color=SLATE_100,
             anchor="w",
         )
@@ -3062,7 +4124,7 @@ class SettingsWindow:
         version = ctk.CTkLabel(
             details,
             text=f"Version {config.VERSION}",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            font=_font(13),
             text_color=SLATE_400,
             anchor="w",
         )
@@ -3072,7 +4134,7 @@ class SettingsWindow:
         desc = ctk.CTkLabel(
             info,
             text="Local speech-to-text powered by OpenAI Whisper. Your voice stays on your device.",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=_font(12),
             text_color=SLATE_400,
             anchor="w",
             wraplength=500,
@@ -3090,21 +4152,18 @@ class SettingsWindow:
             link = ctk.CTkLabel(
                 info,
                 text=f"↗ {link_text}",
-                font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+                font=_font(13),
                 text_color=PRIMARY,
                 cursor="hand2",
                 anchor="w",
             )
             link.pack(fill="x", pady=(0, SPACE_SM))
+            link.url = url  # None opens the logs folder
 
-            # Hover effects (PRIMARY -> PRIMARY_LIGHT)
-            link.bind("<Enter>", lambda e, l=link: l.configure(text_color=PRIMARY_LIGHT))
-            link.bind("<Leave>", lambda e, l=link: l.configure(text_color=PRIMARY))
-
-            if url:
-                link.bind("<Button-1>", lambda e, u=url: webbrowser.open(u))
-            elif link_text == "Open Logs Folder":
-                link.bind("<Button-1>", lambda e: self._open_logs_folder())
+            # Shared handlers; hover goes PRIMARY -> PRIMARY_LIGHT
+            link.bind("<Enter>", self._on_link_enter)
+            link.bind("<Leave>", self._on_link_leave)
+            link.bind("<Button-1>", self._on_link_click)
 
         # System Info section (lazy-loaded for faster startup)
         sys_info = self._create_section_header(section, "System Information", show_divider=True)
@@ -3112,13 +4171,29 @@ class SettingsWindow:
         self._sys_info_label = ctk.CTkLabel(
             sys_info,
             text="Loading...",
-            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            font=_font(12),
             text_color=SLATE_400,
             anchor="w",
             justify="left",
         )
         self._sys_info_label.pack(fill="x")
 
+    def _on_link_enter(self, event):
+        """Highlight an About link (CTkLabel binds its inner widgets, so the link is their master)."""
+        event.widget.master.configure(text_color=PRIMARY_LIGHT)
+
+    def _on_link_leave(self, event):
+        """Restore an About link's colour."""
+        event.widget.master.configure(text_color=PRIMARY)
+
+    def _on_link_click(self, event):
+        """Open an About link's URL, or the logs folder for the link without one."""
+        url = event.widget.master.url
+        if url:
+            webbrowser.open(url)
+        else:
+            self._open_logs_folder()
+
     def _open_logs_folder(self):
         """Open logs folder."""
         logs_dir = os.path.join(os.path.dirname(__file__), "logs")
@@ -3130,37 +4205,53 @@ class SettingsWindow:
         """Populate system info label (called lazily when About tab is first shown)."""
         if self._sys_info_loaded or not self._sys_info_label:
             return
+        self._sys_info_loaded = True
 
-        info_text = []
-        try:
-            import sys
-            info_text.append(f"Python: {sys.version.split()[0]}")
-        except Exception:
-            pass
+        if SettingsWindow._SYS_INFO_CACHE is not None:
+            self._sys_info_label.configure(text=SettingsWindow._SYS_INFO_CACHE)
+            return
+
+        # Importing torch can take seconds; keep it off the Tk thread
+        threading.Thread(target=self._collect_sysinfo, args=(self.window,), daemon=True).start()
+
+    def _collect_sysinfo(self, window):
+        """Build the system info text on a worker thread and hand it to the Tk thread."""
+        info_text = [f"Python: {sys.version.split()[0]}"]
 
         try:
             import torch
             info_text.append(f"PyTorch: {torch.__version__}")
-            if torch.cuda.is_available():
+
+            # is_available() can hang on a broken driver install
+            cuda = []
+            probe = threading.Thread(target=lambda: cuda.append(torch.cuda.is_available()), daemon=True)
+            probe.start()
+            probe.join(3)
+            if cuda and cuda[0]:
                 info_text.append(f"CUDA: {torch.version.cuda}")
         except ImportError:
             info_text.append("PyTorch: Not installed")
 
         try:
-            import faster_whisper
-            info_text.append(f"Whisper: faster-whisper")
+            import faster_whisper  # noqa: F401
+            info_text.append("Whisper: faster-whisper")
         except ImportError:
             pass
 
-        self._sys_info_label.configure(text="\n".join(info_text))
-        self._sys_info_loaded = True
+        SettingsWindow._SYS_INFO_CACHE = "\n".join(info_text)
+        window.after(0, self._apply_system_info)
+
+    def _apply_system_info(self):
+        """Show the probed system info (runs on the Tk thread)."""
+        if self._sys_info_label:
+            self._sys_info_label.configure(text=SettingsWindow._SYS_INFO_CACHE)
 
     # =========================================================================
     # AUTOSAVE
     # =========================================================================
 
     def _show_save_status(self, state):
-        """Show save status in sidebar: 'saving', 'saved', or 'error'."""
+        """Show save status in sidebar: 'saving', 'saved', 'error', or None to clear."""
         if not self._status_label:
             return
 
@@ -3179,6 +4270,8 @@ class SettingsWindow:
             )
         elif state == "error":
             self._status_label.configure(text="Save failed", text_color=ERROR)
+        else:
+            self._status_label.configure(text="")
 
     def _build_config_dict(self):
         """Build configuration dictionary from current widget values."""
@@ -3192,19 +4285,20 @@ class SettingsWindow:
         device_info = self.get_selected_device_info()
 
         # Convert language labels to codes
-        lang_code = settings_logic.language_label_to_code(self.lang_var.get())
-        trans_lang_code = settings_logic.language_label_to_code(self.trans_lang_var.get())
+        lang_label = self.lang_var.get()
+        lang_code = LANGUAGE.rev.get(lang_label, lang_label)
+        trans_lang_label = self.trans_lang_var.get()
+        trans_lang_code = LANGUAGE.rev.get(trans_lang_label, trans_lang_label)
 
         # Convert processing mode
-        processing_mode = settings_logic.processing_mode_label_to_code(
-            self.processing_mode_var.get()
-        )
+        mode_label = self.processing_mode_var.get()
+        processing_mode = PROCESSING_MODE.rev.get(mode_label, mode_label.lower())
 
         # Convert display labels back to internal values
-        recording_mode = RECORDING_MODE_VALUES.get(self.mode_var.get(), "push_to_talk")
-        paste_mode = PASTE_MODE_VALUES.get(self.paste_mode_var.get(), "clipboard")
-        preview_position = PREVIEW_POSITION_VALUES.get(self.preview_position_var.get(), "bottom_right")
-        preview_theme = PREVIEW_THEME_VALUES.get(self.preview_theme_var.get(), "dark")
+        recording_mode = RECORDING_MODE.rev.get(self.mode_var.get(), "push_to_talk")
+        paste_mode = PASTE_MODE.rev.get(self.paste_mode_var.get(), "clipboard")
+        preview_position = PREVIEW_POSITION.rev.get(self.preview_position_var.get(), "bottom_right")
+        preview_theme = PREVIEW_THEME.rev.get(self.preview_theme_var.get(), "dark")
 
         # Convert hotkey string to dict format expected by config
         if isinstance(self.hotkey, str):
@@ -3230,10 +4324,7 @@ class SettingsWindow:
             "noise_gate_enabled": self.noise_gate_var.get(),
             "noise_gate_threshold_db": self.noise_threshold_var.get(),
             "audio_feedback_volume": self.volume_var.get(),
-            "sound_processing": self.sound_processing_var.get(),
-            "sound_success": self.sound_success_var.get(),
-            "sound_error": self.sound_error_var.get(),
-            "sound_command": self.sound_command_var.get(),
+            **{key: getattr(self, attr).get() for attr, key, _ in SOUND_CHECKBOXES},
             "voice_commands_enabled": self.voice_commands_var.get(),
             "scratch_that_enabled": self.scratch_that_var.get(),
             "filler_removal_enabled": self.filler_var.get(),
@@ -3255,111 +4346,105 @@ class SettingsWindow:
         }
 
     def _autosave(self):
-        """Save current settings immediately (called by widget callbacks)."""
+        """Queue an autosave (called by widget callbacks); bursts coalesce into one write."""
+        if not self._autosave_debounce.pending:
+            self._show_save_status("saving")  # First change of a burst
+        self._autosave_debounce.schedule()
+
+    def _autosave_now(self):
+        """Queue the current settings for the writer thread, skipping them if unchanged."""
+        # One save writes every setting, so any other pending save is redundant
+        self._autosave_debounce.cancel()
+        self._text_debounce.cancel()
         try:
             new_config = self._build_config_dict()
+            if new_config == self._queued_config:
+                self._show_save_status(None)  # Nothing changed; drop "Saving..."
+                return
 
-            # Save to file
-            config.save_config(new_config)
-
-            # Update startup registry if needed
-            config.set_startup_enabled(self.startup_var.get())
-
-            # Show status
-            self._show_save_status("saved")
-
-            # Notify main app (for settings that affect runtime)
-            if self.on_save_callback:
-                self.on_save_callback(new_config)
+            # Replace any write the worker hasn't picked up yet
+            try:
+                self._save_queue.get_nowait()
+                self._save_queue.task_done()
+            except queue.Empty:
+                pass
+            self._save_queue.put(new_config)
+            self._queued_config = new_config
 
-        except Exception as e:
+        except Exception:
             self._show_save_status("error")
-            print(f"Autosave error: {e}")
-
-    # =========================================================================
-    # SAVE / RESET / CLOSE (Legacy - save() kept for compatibility)
-    # =========================================================================
+            log.exception("Autosave failed")
+
+    def _save_worker(self):
+        """Write queued configs to disk and the startup registry off the Tk thread."""
+        while True:
+            new_config = self._save_queue.get()
+            if new_config is None:
+                self._save_queue.task_done()
+                return  # close() is done with the writer
+            try:
+                config.save_config(new_config)
+                config.set_startup_enabled(new_config["start_with_windows"])
+                self._last_saved_config = new_config
+                self._save_results.put(new_config)
+            except Exception:
+                log.exception("Autosave failed")
+                self._save_results.put(None)
+            finally:
+                # Before touching Tk, so close() can wait on join() without deadlocking
+                self._save_queue.task_done()
 
-    def save(self):
-        """Save settings."""
-        # Validate inputs
-        rate_str = self.rate_var.get()
-        rate_value = rate_str.split()[0]
-        sample_rate = settings_logic.validate_sample_rate(rate_value)
-        silence_duration = settings_logic.validate_silence_duration(self.silence_var.get())
+            try:
+                self.window.after(0, self._drain_save_results)
+            except Exception:
+                pass  # Window closing; close() drains the results itself
 
-        # Get device info
-        device_info = self.get_selected_device_info()
+    def _drain_save_results(self):
+        """Report finished background saves (runs on the Tk thread)."""
+        while True:
+            try:
+                new_config = self._save_results.get_nowait()
+            except queue.Empty:
+                return
 
-        # Convert language labels to codes
-        lang_code = settings_logic.language_label_to_code(self.lang_var.get())
-        trans_lang_code = settings_logic.language_label_to_code(self.trans_lang_var.get())
+            if new_config is None:
+                self._queued_config = None  # Let the next change retry the write
+                self._show_save_status("error")
+                continue
 
-        # Convert processing mode
-        processing_mode = settings_logic.processing_mode_label_to_code(
-            self.processing_mode_var.get()
-        )
+            self._show_save_status("saved")
 
-        # Convert display labels back to internal values
-        recording_mode = RECORDING_MODE_VALUES.get(self.mode_var.get(), "push_to_talk")
-        paste_mode = PASTE_MODE_VALUES.get(self.paste_mode_var.get(), "clipboard")
-        preview_position = PREVIEW_POSITION_VALUES.get(self.preview_position_var.get(), "bottom_right")
-        preview_theme = PREVIEW_THEME_VALUES.get(self.preview_theme_var.get(), "dark")
+            # Notify main app (for settings that affect runtime)
+            if self.on_save_callback:
+                self.on_save_callback(new_config)
 
-        # Convert hotkey string to dict format expected by config
-        if isinstance(self.hotkey, str):
-            hotkey_dict = {"ctrl": False, "shift": False, "alt": False, "key": self.hotkey}
-        else:
-            hotkey_dict = self.hotkey
+    def _finish_saves(self):
+        """Wait for queued autosaves to land and report them."""
+        self._save_queue.join()
+        self._drain_save_results()
 
-        new_config = {
-            "model_size": self.model_var.get(),
-            "language": lang_code,
-            "translation_enabled": self.translation_enabled_var.get(),
-            "translation_source_language": trans_lang_code,
-            "sample_rate": sample_rate,
-            "hotkey": hotkey_dict,
-            "recording_mode": recording_mode,
-            "silence_duration_sec": silence_duration,
-            "audio_feedback": self.feedback_var.get(),
-            "input_device": device_info,
-            "auto_paste": self.autopaste_var.get(),
-            "paste_mode": paste_mode,
-            "start_with_windows": self.startup_var.get(),
-            "processing_mode": processing_mode,
-            "noise_gate_enabled": self.noise_gate_var.get(),
-            "noise_gate_threshold_db": self.noise_threshold_var.get(),
-            "audio_feedback_volume": self.volume_var.get(),
-            "sound_processing": self.sound_processing_var.get(),
-            "sound_success": self.sound_success_var.get(),
-            "sound_error": self.sound_error_var.get(),
-            "sound_command": self.sound_command_var.get(),
-            "voice_commands_enabled": self.voice_commands_var.get(),
-            "scratch_that_enabled": self.scratch_that_var.get(),
-            "filler_removal_enabled": self.filler_var.get(),
-            "filler_removal_aggressive": self.filler_aggressive_var.get(),
-            "custom_fillers": self.config.get("custom_fillers", []),
-            "custom_dictionary": self.custom_dictionary,
-            "custom_vocabulary": self.custom_vocabulary,
-            "custom_commands": self.custom_commands,
-            "ai_cleanup_enabled": self.ai_cleanup_var.get(),
-            "ai_cleanup_mode": self.ai_mode_var.get(),
-            "ai_formality_level": self.ai_formality_var.get(),
-            "ollama_model": self.ai_model_var.get(),
-            "ollama_url": self.config.get("ollama_url", "http://localhost:11434"),
-            "preview_enabled": self.preview_enabled_var.get(),
-            "preview_position": preview_position,
-            "preview_theme": preview_theme,
-            "preview_auto_hide_delay": float(self.preview_delay_var.get() or 2.0),
-            "preview_font_size": self.preview_font_size_var.get(),
-        }
+    def _write_config_now(self):
+        """Write the current settings on this thread, skipping them if already on disk."""
+        new_config = self._build_config_dict()
+        self._queued_config = new_config
+        if new_config == self._last_saved_config:
+            return
 
         config.save_config(new_config)
-        config.set_startup_enabled(self.startup_var.get())
+        config.set_startup_enabled(new_config["start_with_windows"])
+        self._last_saved_config = new_config
 
         if self.on_save_callback:
             self.on_save_callback(new_config)
 
+    # =========================================================================
+    # SAVE / RESET / CLOSE (Legacy - save() kept for compatibility)
+    # =========================================================================
+
+    def save(self):
+        """Save settings and close (skips the write if autosave already saved them)."""
+        self._finish_saves()
+        self._write_config_now()
         self.close()
 
     def get_selected_device_info(self):
@@ -3370,61 +4455,80 @@ class SettingsWindow:
                 return info
         return None
 
-    def _show_confirm_dialog(self, title, message):
-        """Show a branded confirmation dialog. Returns True if confirmed."""
-        result = [False]
-
+    def _build_confirm_dialog(self):
+        """Build the confirm dialog once, hidden; _show_confirm_dialog reuses it."""
         dlg = ctk.CTkToplevel(self.window)
-        dlg.title(title)
+        dlg.withdraw()
         dlg.geometry("350x150")
         dlg.configure(fg_color=SLATE_900)
         dlg.transient(self.window)
-        dlg.grab_set()
         dlg.resizable(False, False)
 
         # Set icon
         try:
-            icon_path = resource_path("icon.ico")
-            if os.path.exists(icon_path):
-                dlg.after(200, lambda: dlg.iconbitmap(icon_path))
+            icon_path = _existing_resource("icon.ico")
+            if icon_path:
+                dlg.after(200, dlg.iconbitmap, icon_path)
         except Exception:
             pass
 
-        # Center on parent
-        dlg.update_idletasks()
-        x = self.window.winfo_x() + (self.window.winfo_width() - 350) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - 150) // 2
-        dlg.geometry(f"350x150+{x}+{y}")
-
         frame = ctk.CTkFrame(dlg, fg_color="transparent")
         frame.pack(fill="both", expand=True, padx=SPACE_LG, pady=SPACE_LG)
 
-        ctk.CTkLabel(
+        self._confirm_label = ctk.CTkLabel(
             frame,
-            text=message,
-            font=ctk.CTkFont(family=FONT_FAMILY, size=14),
+            text="",
+            font=_font(14),
             text_color=SLATE_200,
             wraplength=300
-        ).pack(pady=(SPACE_MD, SPACE_LG))
+        )
+        self._confirm_label.pack(pady=(SPACE_MD, SPACE_LG))
 
-        def confirm():
-            result[0] = True
-            dlg.destroy()
+        # Every way out writes the answer, which ends wait_variable
+        self._confirm_result = ctk.BooleanVar(master=dlg, value=False)
 
         btn_row = ctk.CTkFrame(frame, fg_color="transparent")
         btn_row.pack(side="bottom")
 
         ctk.CTkButton(
             btn_row, text="Yes", width=80, fg_color=PRIMARY,
-            hover_color=PRIMARY_DARK, command=confirm
+            hover_color=PRIMARY_DARK, command=lambda: self._confirm_result.set(True)
         ).pack(side="left", padx=(0, SPACE_SM))
         ctk.CTkButton(
             btn_row, text="No", width=80, fg_color=SLATE_700,
-            hover_color=SLATE_600, command=dlg.destroy
+            hover_color=SLATE_600, command=lambda: self._confirm_result.set(False)
         ).pack(side="left")
+        dlg.protocol("WM_DELETE_WINDOW", lambda: self._confirm_result.set(False))
+
+        self._confirm_dlg = dlg
+
+    def _show_confirm_dialog(self, title, message):
+        """Show a branded confirmation dialog. Returns True if confirmed."""
+        if self._confirm_dlg is None:
+            self._build_confirm_dialog()
+        dlg = self._confirm_dlg
 
-        dlg.wait_window()
-        return result[0]
+        dlg.title(title)
+        self._confirm_label.configure(text=message)
+
+        # Center on parent
+        _center_dialog(dlg, self.window, 350, 150)
+        dlg.deiconify()
+        dlg.grab_set()
+
+        dlg.wait_variable(self._confirm_result)
+        dlg.grab_release()
+        dlg.withdraw()
+        return self._confirm_result.get()
+
+    @functools.cached_property
+    def _reset_values(self):
+        """Display values for _RESET_SPEC, in spec order (defaults never change at runtime)."""
+        defaults = settings_logic.get_defaults()
+        return tuple(
+            transform(defaults[key]) if transform else defaults[key]
+            for _, key, transform in self._RESET_SPEC
+        )
 
     def reset_defaults(self):
         """Reset all settings to defaults."""
@@ -3434,53 +4538,16 @@ class SettingsWindow:
         ):
             return
 
-        defaults = settings_logic.get_defaults()
-
-        # General tab
-        self.mode_var.set(RECORDING_MODE_LABELS.get(defaults["recording_mode"], "Push-to-Talk"))
-        self._update_hotkey_help_text()  # Update help text after mode change
-        self.lang_var.set(settings_logic.language_code_to_label(defaults["language"]))
-        self.autopaste_var.set(defaults["auto_paste"])
-        self.paste_mode_var.set(PASTE_MODE_LABELS.get(defaults["paste_mode"], "Clipboard"))
-        self._update_paste_help_text()  # Update help text after paste mode change
-        self.preview_enabled_var.set(defaults["preview_enabled"])
-        self.preview_position_var.set(PREVIEW_POSITION_LABELS.get(defaults["preview_position"], "Bottom Right"))
-        self.preview_theme_var.set(PREVIEW_THEME_LABELS.get(defaults["preview_theme"], "Dark"))
-        self.preview_delay_var.set(str(defaults["preview_auto_hide_delay"]))
-        self.preview_font_size_var.set(defaults["preview_font_size"])
-        self.startup_var.set(defaults["start_with_windows"])
-
-        # Audio tab
+        for (attr, _, _), value in zip(self._RESET_SPEC, self._reset_values):
+            getattr(self, attr).set(value)
         self.device_var.set("System Default")
-        self.rate_var.set(SAMPLE_RATE_OPTIONS.get(defaults["sample_rate"], "16000 Hz"))
-        self.noise_gate_var.set(defaults["noise_gate_enabled"])
-        self.noise_threshold_var.set(defaults["noise_gate_threshold_db"])
-        self.feedback_var.set(defaults["audio_feedback"])
-        self.volume_var.set(int(defaults["audio_feedback_volume"] * 100))
-        self.sound_processing_var.set(defaults["sound_processing"])
-        self.sound_success_var.set(defaults["sound_success"])
-        self.sound_error_var.set(defaults["sound_error"])
-        self.sound_command_var.set(defaults["sound_command"])
-
-        # Recognition tab
-        self.model_var.set(defaults["model_size"])
-        self._model_display_var.set(config.MODEL_DISPLAY_NAMES.get(defaults["model_size"], defaults["model_size"]))
-        self.silence_var.set(str(defaults["silence_duration_sec"]))
-        self.processing_mode_var.set(config.PROCESSING_MODE_LABELS.get(defaults["processing_mode"], "Auto"))
-        self.translation_enabled_var.set(defaults["translation_enabled"])
-        self.trans_lang_var.set(settings_logic.language_code_to_label(defaults["translation_source_language"]))
 
-        # Text tab
-        self.voice_commands_var.set(defaults["voice_commands_enabled"])
-        self.scratch_that_var.set(defaults["scratch_that_enabled"])
-        self.filler_var.set(defaults["filler_removal_enabled"])
-        self.filler_aggressive_var.set(defaults["filler_removal_aggressive"])
+        # Help text follows the recording and paste modes
+        self._update_hotkey_help_text()
+        self._update_paste_help_text()
 
-        # Advanced tab
-        self.ai_cleanup_var.set(defaults["ai_cleanup_enabled"])
-        self.ai_mode_var.set(defaults["ai_cleanup_mode"])
-        self.ai_formality_var.set(defaults["ai_formality_level"])
-        self.ai_model_var.set(defaults["ollama_model"])
+        # Programmatic sets don't autosave on their own
+        self._autosave()
 
     def _setup_keyboard_navigation(self):
         """Setup keyboard navigation for accessibility."""
@@ -3492,17 +4559,31 @@ class SettingsWindow:
 
     def close(self):
         """Close the settings window."""
-        # Flush any pending autosaves
-        if self._text_debounce:
-            self._text_debounce.flush()
-        if self._slider_debounce:
-            self._slider_debounce.flush()
+        # Write unsaved settings here instead of queueing them: the window the
+        # writer reports back through is about to be destroyed. This also covers
+        # a failed background write and edits that never armed a debouncer.
+        for debounce in (self._autosave_debounce, self._text_debounce):
+            if debounce:
+                debounce.cancel()
+        self._finish_saves()
+        if self.window:
+            try:
+                self._write_config_now()
+            except Exception:
+                log.exception("Autosave failed")
+            self._save_queue.put(None)  # Stop the writer thread
 
         if self.noise_test_running:
             self.stop_noise_test()
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
         if self.window:
             self.window.destroy()
             self.window = None
+            _font.cache_clear()
+            _cached_ctk_image.cache_clear()
+            SettingsWindow._GRADIENT_CACHE.clear()
 
 
 def open_settings(current_config, on_save_callback=None):
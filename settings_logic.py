@@ -5,6 +5,9 @@ This module contains all configuration validation, detection logic,
 and data transformation that can be tested independently of the UI.
 """
 
+import re
+import time
+
 import config
 
 
@@ -95,6 +98,56 @@ def get_cuda_status():
     return (True, "CUDA Available", "via ctranslate2")
 
 
+# pip lines worth showing while GPU libraries install
+_PIP_STATUS_RE = re.compile(r"^\s*(Collecting|Downloading|Installing|Successfully)\s+(.*)$")
+_PIP_STATUS_MAX_LEN = 60
+
+
+def pip_status_line(line):
+    """Turn a pip output line into a short install status, if it is a phase change.
+
+    Args:
+        line: One line of `pip install` output
+
+    Returns:
+        str or None: e.g. "Downloading nvidia_cudnn_cu12-9.1.0.70-...", or None
+        for lines that aren't Collecting/Downloading/Installing/Successfully
+    """
+    match = _PIP_STATUS_RE.match(line)
+    if not match:
+        return None
+    verb, rest = match.groups()
+    # Drop URLs and trailing size/hash details, keep the package name
+    rest = rest.split("://")[-1].rsplit("/", 1)[-1].split(" (")[0].strip()
+    text = f"{verb} {rest}".strip()
+    if len(text) > _PIP_STATUS_MAX_LEN:
+        text = text[:_PIP_STATUS_MAX_LEN - 3] + "..."
+    return text
+
+
+_PIP_SIZE_RE = re.compile(r"^\s*Downloading\s.*\((\d+(?:\.\d+)?) (kB|MB|GB)\)\s*$")
+_PIP_SIZE_UNITS = {"kB": 1000, "MB": 1000 ** 2, "GB": 1000 ** 3}
+
+# Rough total download for the CUDA libraries, used to scale install progress
+GPU_INSTALL_BYTES_ESTIMATE = int(2.5 * 1024 ** 3)
+
+
+def pip_download_bytes(line):
+    """Return the size pip announces for a download, in bytes.
+
+    Args:
+        line: One line of `pip install` output
+
+    Returns:
+        int or None: Size from e.g. "Downloading foo.whl (410.6 MB)", or None
+    """
+    match = _PIP_SIZE_RE.match(line)
+    if not match:
+        return None
+    value, unit = match.groups()
+    return int(float(value) * _PIP_SIZE_UNITS[unit])
+
+
 # =============================================================================
 # Configuration Validation
 # =============================================================================
@@ -295,18 +348,53 @@ def get_language_labels():
     return list(config.LANGUAGE_LABELS.values())
 
 
+def filter_options(values, query):
+    """Filter dropdown options by a case-insensitive substring search.
+
+    Args:
+        values: Option labels in display order
+        query: Text typed into the dropdown's search box
+
+    Returns:
+        list: Matching labels, in their original order
+    """
+    query = query.strip().lower()
+    if not query:
+        return list(values)
+    return [v for v in values if query in v.lower()]
+
+
 # =============================================================================
 # Audio Device Detection
 # =============================================================================
 
+# Seconds an enumerated device list is reused before PortAudio is queried again
+DEVICE_CACHE_TTL = 5.0
+
+_devices_cache = None  # (monotonic timestamp, device list)
+
+
 def get_input_devices():
     """Get list of available audio input devices.
 
+    Enumeration is slow, so the result is reused for DEVICE_CACHE_TTL
+    seconds; call invalidate_input_devices() to force a fresh query.
+
     Returns:
         list: List of (display_name, device_info) tuples
               device_info is None for System Default
     """
-    return config.get_input_devices()
+    global _devices_cache
+    now = time.monotonic()
+    if _devices_cache is None or now - _devices_cache[0] > DEVICE_CACHE_TTL:
+        _devices_cache = (now, config.get_input_devices())
+    return list(_devices_cache[1])
+
+
+def invalidate_input_devices():
+    """Drop the cached device list so the next lookup re-enumerates."""
+    global _devices_cache
+    _devices_cache = None
 
 
 def find_device_by_name(devices_list, device_name):
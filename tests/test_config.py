@@ -88,6 +88,24 @@ class TestConfigLoadSave:
         assert loaded['language'] == 'auto'
         assert loaded['audio_feedback'] is False
 
+    def test_save_config_skips_identical_write(self, tmp_path, mocker):
+        """Re-saving unchanged settings should not rewrite the file."""
+        config_file = tmp_path / "test_config.json"
+        mocker.patch('config.get_config_path', return_value=str(config_file))
+        replace = mocker.spy(config.os, 'replace')
+
+        test_config = config.DEFAULTS.copy()
+        config.save_config(test_config)
+        config.save_config(dict(test_config))
+        assert replace.call_count == 1
+
+        # A file changed behind our back is written again
+        config_file.write_text("{}")
+        config.save_config(test_config)
+        assert replace.call_count == 2
+        assert config.load_config()['model_size'] == test_config['model_size']
+        assert not list(tmp_path.glob(".settings-*"))
+
     def test_load_config_merges_with_defaults(self, tmp_path, mocker):
         """Loading partial config should fill in missing keys from defaults."""
         config_file = tmp_path / "partial_config.json"
@@ -73,6 +73,46 @@ class TestLanguageConversions:
             assert back_to_code == code, f"Round-trip failed for {code}"
 
 
+class TestFilterOptions:
+    """Test dropdown search filtering."""
+
+    def test_empty_query_returns_all(self):
+        values = ["English", "Spanish"]
+        assert settings_logic.filter_options(values, "  ") == values
+
+    def test_case_insensitive_substring(self):
+        values = ["English", "Spanish", "Swedish"]
+        assert settings_logic.filter_options(values, "SH") == values
+
+    def test_keeps_original_order(self):
+        values = settings_logic.get_language_labels()
+        result = settings_logic.filter_options(values, "an")
+        assert result == [v for v in values if "an" in v.lower()]
+
+
+class TestPipStatusLine:
+    """Test GPU install status lines parsed from pip output."""
+
+    def test_download_shows_file_name(self):
+        line = "  Downloading https://example.org/p/nvidia_cublas_cu12-12.4.whl (400.0 MB)"
+        assert settings_logic.pip_status_line(line) == "Downloading nvidia_cublas_cu12-12.4.whl"
+
+    def test_other_lines_ignored(self):
+        assert settings_logic.pip_status_line("Requirement already satisfied: numpy") is None
+
+    def test_long_status_truncated(self):
+        status = settings_logic.pip_status_line("Collecting " + "x" * 100)
+        assert len(status) == 60 and status.endswith("...")
+
+    def test_download_size_in_bytes(self):
+        line = "  Downloading nvidia_cudnn_cu12-9.1.0.70-py3-none-win_amd64.whl (679.1 MB)"
+        assert settings_logic.pip_download_bytes(line) == 679_100_000
+        assert settings_logic.pip_download_bytes("Downloading six.whl (11 kB)") == 11_000
+
+    def test_download_size_missing(self):
+        assert settings_logic.pip_download_bytes("Collecting nvidia-cublas-cu12>=12.1.0") is None
+
+
 class TestProcessingModeConversions:
     """Test processing mode code ↔ label conversions."""
 
@@ -174,6 +214,49 @@ class TestSampleRateOptions:
         assert 48000 in settings_gui.SAMPLE_RATE_OPTIONS
 
 
+class TestLabelMap:
+    """Test the two-way LabelMap used for dropdown labels."""
+
+    def test_forward_and_reverse(self):
+        import settings_gui
+        label_map = settings_gui.LabelMap([("a", "Alpha"), ("b", "Beta")])
+        assert label_map.fwd["a"] == "Alpha"
+        assert label_map.rev["Beta"] == "b"
+        assert list(label_map.fwd.values()) == ["Alpha", "Beta"]
+
+    def test_labels_in_display_order(self):
+        import settings_gui
+        label_map = settings_gui.LabelMap([("b", "Beta"), ("a", "Alpha")])
+        assert label_map.labels == ("Beta", "Alpha")
+
+    def test_read_only(self):
+        import settings_gui
+        with pytest.raises(TypeError):
+            settings_gui.RECORDING_MODE.fwd["new_mode"] = "New"
+
+    def test_legacy_names_share_maps(self):
+        import settings_gui
+        assert settings_gui.RECORDING_MODE_LABELS is settings_gui.RECORDING_MODE.fwd
+        assert settings_gui.RECORDING_MODE_VALUES is settings_gui.RECORDING_MODE.rev
+
+    def test_reset_spec_keys_are_defaults(self):
+        """Every reset_defaults entry should map a real default to a settable value."""
+        import settings_gui
+        defaults = settings_logic.get_defaults()
+        for attr, key, transform in settings_gui.SettingsWindow._RESET_SPEC:
+            assert key in defaults, attr
+            if transform:
+                transform(defaults[key])
+
+    def test_language_and_mode_maps_match_logic(self):
+        """The precomputed maps should agree with the settings_logic converters."""
+        import settings_gui
+        for label in settings_gui.LANGUAGE.labels:
+            assert settings_gui.LANGUAGE.rev[label] == settings_logic.language_label_to_code(label)
+        for label in settings_gui.PROCESSING_MODE.labels:
+            assert settings_gui.PROCESSING_MODE.rev[label] == settings_logic.processing_mode_label_to_code(label)
+
+
 # =============================================================================
 # Validation Tests
 # =============================================================================
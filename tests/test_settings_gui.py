@@ -113,3 +113,24 @@ class TestCheckCudaAvailable:
 
         result = settings_logic.check_cuda_available()
         assert isinstance(result, bool)
+
+
+class TestInputDeviceCache:
+    """Tests for the cached get_input_devices() wrapper."""
+
+    def test_reuses_enumeration_until_invalidated(self, mocker):
+        """Repeated lookups should query PortAudio once until invalidated."""
+        import settings_logic
+
+        query = mocker.patch("config.get_input_devices", return_value=[("System Default", None)])
+        settings_logic.invalidate_input_devices()
+        try:
+            assert settings_logic.get_input_devices() == [("System Default", None)]
+            settings_logic.get_input_devices()
+            assert query.call_count == 1
+
+            settings_logic.invalidate_input_devices()
+            settings_logic.get_input_devices()
+            assert query.call_count == 2
+        finally:
+            settings_logic.invalidate_input_devices()
@@ -386,6 +386,188 @@ class TestResourceCleanup:
         pass
 
 
+class FakeAfterWindow:
+    """Minimal stand-in for Tk's after()/after_cancel() with a fake clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.pending = {}  # after_id -> (fire_time, callback)
+        self.after_calls = 0
+        self.cancel_calls = 0
+
+    def clock(self):
+        return self.now
+
+    def after(self, delay_ms, callback):
+        self.after_calls += 1
+        self.pending[self.after_calls] = (self.now + delay_ms / 1000, callback)
+        return self.after_calls
+
+    def after_cancel(self, after_id):
+        self.cancel_calls += 1
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        while self.pending:
+            after_id = min(self.pending, key=lambda k: (self.pending[k][0], k))
+            fire_time, callback = self.pending.pop(after_id)
+            self.now = max(self.now, fire_time)
+            callback()
+
+
+@pytest.fixture
+def fake_window(monkeypatch):
+    """Fake Tk window whose clock drives settings_gui's scheduler."""
+    import settings_gui
+    window = FakeAfterWindow()
+    monkeypatch.setattr(settings_gui.time, "monotonic", window.clock)
+    return window
+
+
+class TestDebounceManager:
+    """Test debounced autosave scheduling."""
+
+    def test_rapid_schedules_coalesce(self, fake_window):
+        """Several schedule() calls should produce a single save."""
+        import settings_gui
+        window = fake_window
+        saves = []
+        debounce = settings_gui.DebounceManager(window, lambda: saves.append(1))
+
+        for _ in range(5):
+            debounce.schedule()
+        window.run_pending()
+
+        assert saves == [1]
+
+    def test_flush_and_cancel_skip_when_idle(self, fake_window):
+        """flush()/cancel() with nothing pending shouldn't touch Tk."""
+        import settings_gui
+        window = fake_window
+        debounce = settings_gui.DebounceManager(window, lambda: None)
+
+        debounce.flush()
+        debounce.cancel()
+
+        assert window.cancel_calls == 0
+
+    def test_schedule_during_save_rearms(self, fake_window):
+        """schedule() from inside the save callback should re-arm once."""
+        import settings_gui
+        window = fake_window
+        saves = []
+
+        def save():
+            saves.append(1)
+            if len(saves) == 1:
+                debounce.schedule()
+
+        debounce = settings_gui.DebounceManager(window, save)
+        debounce.schedule()
+        window.run_pending()
+
+        assert saves == [1, 1]
+
+    def test_pending_until_save_runs(self, fake_window):
+        """pending should be True only between schedule() and the save."""
+        import settings_gui
+        window = fake_window
+        debounce = settings_gui.DebounceManager(window, lambda: None)
+
+        assert not debounce.pending
+        debounce.schedule()
+        assert debounce.pending
+        window.run_pending()
+        assert not debounce.pending
+
+    def test_managers_share_one_tk_timer(self, fake_window):
+        """Debouncers on the same window should share a single after() timer."""
+        import settings_gui
+        window = fake_window
+        saves = []
+        slow = settings_gui.DebounceManager(window, lambda: saves.append("slow"), delay_ms=1500)
+        fast = settings_gui.DebounceManager(window, lambda: saves.append("fast"), delay_ms=300)
+
+        slow.schedule()
+        fast.schedule()
+        assert len(window.pending) == 1
+
+        window.run_pending()
+        assert saves == ["fast", "slow"]
+
+
+    def test_failing_save_does_not_drop_others(self, fake_window):
+        """A save that raises shouldn't strand other callbacks due at the same time."""
+        import settings_gui
+        window = fake_window
+        saves = []
+
+        def broken():
+            raise OSError("disk full")
+
+        failing = settings_gui.DebounceManager(window, broken, delay_ms=300)
+        other = settings_gui.DebounceManager(window, lambda: saves.append("other"), delay_ms=300)
+        failing.schedule()
+        other.schedule()
+        window.run_pending()
+
+        assert saves == ["other"]
+        assert not failing.pending and not other.pending
+
+class TestRowClickDispatch:
+    """Test mapping a clicked inner widget back to its list row."""
+
+    def test_finds_tagged_ancestor(self):
+        """Clicks on a nested child should resolve to the tagged row."""
+        import settings_gui
+        row = MagicMock(spec=["master"], master=None)
+        row._history_index = 4
+        label = MagicMock(spec=["master"], master=row)
+        inner = MagicMock(spec=["master"], master=label)
+
+        assert settings_gui._tagged_ancestor(inner, "_history_index") is row
+
+    def test_untagged_returns_none(self):
+        """Widgets outside any tagged row should resolve to None."""
+        import settings_gui
+        widget = MagicMock(spec=["master"], master=None)
+
+        assert settings_gui._tagged_ancestor(widget, "_history_index") is None
+
+
+class TestMeterGradient:
+    """Test the audio meter gradient row."""
+
+    def test_runs_from_success_to_error(self, monkeypatch):
+        """The row should start at the success color and end near the error color."""
+        import numpy
+        import settings_gui
+        monkeypatch.setattr(settings_gui, "np", numpy)
+        settings_gui._meter_gradient_row.cache_clear()
+
+        row = settings_gui._meter_gradient_row(300)
+
+        assert row.shape == (300, 3)
+        assert tuple(row[0]) == settings_gui.SUCCESS_RGB
+        assert all(abs(int(a) - b) <= 3 for a, b in zip(row[-1], settings_gui.ERROR_RGB))
+        assert not row.flags.writeable
+        settings_gui._meter_gradient_row.cache_clear()
+
+
+class TestHotkeyFormatting:
+    """Test hotkey display formatting."""
+
+    def test_formats_string_hotkey(self):
+        """Key names should be title-cased and joined with spaced plus signs."""
+        import settings_gui
+        assert settings_gui._format_hotkey_str("ctrl+shift_r") == "Ctrl + Shift R"
+
+    def test_empty_hotkey(self):
+        """An empty hotkey should display as not set."""
+        import settings_gui
+        assert settings_gui._format_hotkey_str("") == "Not set"
+
+
 # =============================================================================
 # Concurrent Operation Tests
 # =============================================================================